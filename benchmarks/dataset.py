@@ -0,0 +1,56 @@
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator
+
+FIRST_NAMES = (
+    "Juan", "Maria", "Jose", "Ana", "Mark", "Angel", "John Paul", "Kristine", "Carlo", "Jasmine",
+    "Miguel", "Nicole", "Rafael", "Patricia", "Christian", "Camille", "Joshua", "Bea", "Paolo", "Andrea",
+    "Gabriel", "Samantha", "Adrian", "Princess", "Kenneth", "Erika", "Jericho", "Alyssa", "Renz", "Trisha"
+)
+LAST_NAMES = (
+    "Santos", "Reyes", "Cruz", "Bautista", "Ocampo", "Garcia", "Mendoza", "Torres", "Tomas", "Andrada",
+    "Castillo", "Flores", "Villanueva", "Ramos", "Castro", "Rivera", "Aquino", "Navarro", "Salazar", "Mercado",
+    "Aguilar", "Dela Cruz", "De Leon", "Pascual", "Gonzales", "Lopez", "Fernandez", "Soriano", "Valdez", "Domingo"
+)
+SCHOOLS = tuple(f"{place} National High School" for place in (
+    "Quezon City", "Marikina", "Pasig", "Caloocan", "Valenzuela", "Malabon", "Taguig", "Makati", "Antipolo", "Cainta"
+)) + ("San Roque Integrated School", "Holy Family Academy", "St. Mary's Academy")
+
+# weights roughly follow a public SHS intake: STEM and ABM fill first, Arts and Design stays small
+STRAND_WEIGHTS = (("STEM", 30), ("ABM", 20), ("GAS", 15), ("HUMSS", 20), ("TVL", 12), ("Arts and Design Track", 3))
+STATUS_WEIGHTS = (("pending", 60), ("approved", 30), ("declined", 10))
+
+def _weighted(rnd: random.Random, weights):
+    values, counts = zip(*weights)
+    return rnd.choices(values, counts)[0]
+
+def generate_students(count: int, seed: int = 0, submitted_by: str = "bench") -> Iterator[Dict[str, Any]]:
+    rnd = random.Random(seed)
+    born_from = date(2006, 1, 1)
+    for i in range(count):
+        first = rnd.choice(FIRST_NAMES)
+        last = rnd.choice(LAST_NAMES)
+        handle = f"{first}.{last}".lower().replace(" ", "")
+        guardian_last = last if rnd.random() < 0.85 else rnd.choice(LAST_NAMES)
+        yield {
+            "first_name": first,
+            "last_name": last,
+            "date_of_birth": (born_from + timedelta(days=rnd.randrange(5 * 365))).isoformat(),
+            "gender": rnd.choice(("Male", "Female")),
+            "email": f"{handle}{i}@example.edu.ph",
+            "phone": f"09{rnd.randrange(10 ** 9):09d}",
+            "guardian": {
+                "name": f"{rnd.choice(FIRST_NAMES)} {guardian_last}",
+                "relation": rnd.choice(("Father", "Mother", "Mother", "Legal Guardian", "Others")),
+                "phone": ""
+            },
+            "academic": {
+                "previous_school": rnd.choice(SCHOOLS),
+                "strand": _weighted(rnd, STRAND_WEIGHTS),
+                "semester": rnd.choice(("1st Semester", "2nd Semester")),
+                "school_year": rnd.choice(("2025 - 2026", "2026 - 2027"))
+            },
+            "status": _weighted(rnd, STATUS_WEIGHTS),
+            "submitted_by": submitted_by,
+            "submitted_role": "staff"
+        }
@@ -0,0 +1,225 @@
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop
+from PyQt6.QtWidgets import QApplication
+
+import script
+from benchmarks.dataset import generate_students
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_REPEAT = 20
+LOAD_CHUNK = 1000
+APP_DATABASE = script.DB_NAME
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ms = sorted(x * 1000 for x in samples)
+    return {
+        "n": len(ms),
+        "min_ms": round(ms[0], 3),
+        "median_ms": round(statistics.median(ms), 3),
+        "p95_ms": round(ms[max(0, math.ceil(len(ms) * 0.95) - 1)], 3),
+        "max_ms": round(ms[-1], 3)
+    }
+
+def timed(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+def wait_until(app: QApplication, predicate: Callable[[], bool], timeout: float = 300.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("benchmark step did not finish in time")
+        app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 5)
+
+def configure_backend(args):
+    script.DB_BACKEND = args.backend
+    script.reset_query_stats()
+    if args.backend == "sqlite":
+        script.SQLITE_PATH = args.sqlite_path
+        script.reset_data_layer()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(args.sqlite_path + suffix):
+                os.remove(args.sqlite_path + suffix)
+        script.ensure_schema()
+        return
+    script.DB_HOST = args.host
+    script.DB_USER = args.user
+    script.DB_PASS = args.password
+    script.DB_NAME = args.database
+    script.reset_data_layer()
+    conn = script._connect(database=None)
+    try:
+        conn.cursor().execute(f"DROP DATABASE IF EXISTS {args.database}")
+        conn.commit()
+    finally:
+        conn.close()
+    script.ensure_schema()
+
+def load_dataset(size: int, seed: int) -> float:
+    started = time.perf_counter()
+    batch = []
+    for student in generate_students(size, seed):
+        batch.append(student)
+        if len(batch) >= LOAD_CHUNK:
+            script.insert_students(batch)
+            batch = []
+    script.insert_students(batch)
+    return time.perf_counter() - started
+
+def bench_data_layer(repeat: int) -> Dict[str, Any]:
+    results = {}
+    def allocate_student_id():
+        # rolled back so the benchmark does not burn IDs out of the sequence
+        with script.get_connection() as conn:
+            script._allocate_student_ids(conn)
+            conn.rollback()
+    results["allocate_student_id"] = timed(allocate_student_id, repeat)
+
+    def cold_stats():
+        script.invalidate_dashboard_stats()
+        script.load_dashboard_stats()
+    results["load_dashboard_stats_cold"] = timed(cold_stats, repeat)
+    results["load_dashboard_stats_warm"] = timed(script.load_dashboard_stats, repeat)
+
+    script._search_index = None
+    results["search_students_sql"] = timed(lambda: script.search_students("dela cruz"), repeat)
+    results["query_students_first_page"] = timed(lambda: script.query_students(limit=200), repeat)
+
+    def build_index():
+        script._search_index = None
+        script.build_search_index()
+    results["build_search_index"] = timed(build_index, max(1, repeat // 10))
+    results["search_students_index"] = timed(lambda: script.search_students("dela cruz"), repeat)
+    return results
+
+def bench_widgets(app: QApplication, repeat: int, seed: int) -> Dict[str, Any]:
+    results = {}
+
+    table = script.StudentsTable(role="admin")
+    wait_until(app, lambda: table._pending_search is None)
+
+    def refresh(text: str):
+        table.filter_text = text
+        table.refresh_table()
+        wait_until(app, lambda: table._pending_search is None)
+    results["refresh_table"] = timed(lambda: refresh(""), repeat)
+    results["refresh_table_search"] = timed(lambda: refresh("reyes"), repeat)
+    table.deleteLater()
+
+    dashboard = script.DashboardWidget(role="admin")
+    wait_until(app, lambda: dashboard._loading is None)
+
+    def refresh_dashboard():
+        script.invalidate_dashboard_stats()
+        dashboard.refresh()
+        wait_until(app, lambda: dashboard._loading is None)
+    results["dashboard_refresh"] = timed(refresh_dashboard, repeat)
+    dashboard.deleteLater()
+
+    window = script.MainWindow({"username": "bench", "role": "staff"})
+    students = generate_students(repeat, seed + 1)
+
+    def submit():
+        done = []
+        window._staff_submit(next(students), on_result=done.append, on_error=done.append)
+        wait_until(app, lambda: bool(done))
+        if isinstance(done[0], Exception):
+            raise done[0]
+    results["staff_submit"] = timed(submit, repeat)
+    window.logout()
+    window.deleteLater()
+    app.processEvents()
+    return results
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    regressions = []
+    for size, entry in results["sizes"].items():
+        base_entry = baseline.get("sizes", {}).get(size, {})
+        for name, stats in entry.items():
+            base = base_entry.get(name)
+            if not isinstance(stats, dict) or not isinstance(base, dict):
+                continue
+            if stats["median_ms"] > base["median_ms"] * (1 + tolerance):
+                regressions.append(f"{size} rows: {name} median {stats['median_ms']:.2f} ms "
+                                   f"vs baseline {base['median_ms']:.2f} ms")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run",
+                                     description="Benchmark the enrollment data layer and widgets on synthetic data.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="student counts to test")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="samples per measurement")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", choices=sorted(script.BACKENDS), default="sqlite",
+                        help="storage backend to benchmark; sqlite needs no server")
+    parser.add_argument("--sqlite-path", default=os.path.join(tempfile.gettempdir(), "shs_enrollment_bench.db"),
+                        help="scratch SQLite file, deleted before each size")
+    parser.add_argument("--host", default=script.DB_HOST)
+    parser.add_argument("--user", default=script.DB_USER)
+    parser.add_argument("--password", default=script.DB_PASS)
+    parser.add_argument("--database", default="shs_enrollment_bench",
+                        help="scratch MySQL database, dropped before each size")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", help="earlier JSON report to compare medians against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed median slowdown against the baseline")
+    args = parser.parse_args(argv)
+    if args.backend == "mysql" and args.database == APP_DATABASE:
+        parser.error("refusing to drop the application database; pick a scratch --database")
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    results = {
+        "meta": {
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qt_platform": os.environ.get("QT_QPA_PLATFORM"),
+            "backend": args.backend,
+            "repeat": args.repeat,
+            "seed": args.seed
+        },
+        "sizes": {}
+    }
+    for size in args.sizes:
+        configure_backend(args)
+        entry = {"load_s": round(load_dataset(size, args.seed), 3)}
+        entry.update(bench_data_layer(args.repeat))
+        entry.update(bench_widgets(app, args.repeat, args.seed))
+        entry["statements"] = script.query_stats()
+        results["sizes"][str(size)] = entry
+        print(f"benchmarked {size} students", file=sys.stderr)
+    script.reset_data_layer()
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"regression: {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
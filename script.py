@@ -1,26 +1,445 @@
+import argparse
+import base64
+import csv
+import hashlib
+import hmac
+import json
+import logging
+import logging.handlers
+import os
+import secrets
+import sqlite3
 import sys
-from typing import List, Dict, Any
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict, deque
+from datetime import date, datetime
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache, partial
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QMessageBox, QDialog, QTableWidget, QTableWidgetItem,
+    QLineEdit, QMessageBox, QDialog, QTableView, QAbstractItemView,
     QHeaderView, QFrame, QGraphicsDropShadowEffect, QSizePolicy, QGroupBox,
-    QComboBox, QScrollArea, QGridLayout, QLayout, QStackedWidget
+    QComboBox, QScrollArea, QGridLayout, QStackedWidget, QFileDialog, QProgressBar, QPlainTextEdit, QListWidget
+)
+from PyQt6.QtGui import QPixmap, QColor, QFont, QKeySequence, QShortcut
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 )
-from PyQt6.QtGui import QPixmap, QColor, QFont
-from PyQt6.QtCore import Qt
 import pymysql
 
+DB_BACKEND = os.environ.get("SHS_DB_BACKEND", "mysql")
 DB_NAME = "shs_enrollment"
 DB_HOST = "localhost"
 DB_USER = "root"
 DB_PASS = ""
+SQLITE_PATH = os.environ.get("SHS_SQLITE_PATH", "shs_enrollment.db")
+
+POOL_SIZE = 5
+POOL_TIMEOUT = 10.0
+POOL_IDLE_CHECK = 30.0
+
+def _connect(database=DB_NAME):
+    return pymysql.connect(host=DB_HOST, user=DB_USER, password=DB_PASS, database=database,
+                           charset='utf8mb4', autocommit=False,
+                           client_flag=pymysql.constants.CLIENT.FOUND_ROWS)
+
+DatabaseError = (pymysql.err.Error, sqlite3.Error)
+# errors caused by the row values themselves, as opposed to the statement, connection or server limits
+_DATA_ERRORS = (pymysql.err.IntegrityError, pymysql.err.DataError, sqlite3.IntegrityError, sqlite3.DataError)
+_DISCONNECT_ERRORS = (pymysql.err.OperationalError, pymysql.err.InterfaceError,
+                      sqlite3.OperationalError, sqlite3.ProgrammingError)
+
+SLOW_QUERY_MS = float(os.environ.get("SHS_SLOW_QUERY_MS", "200"))
+TRACE_LOG_PATH = os.environ.get("SHS_TRACE_LOG", "shs_trace.jsonl")
+TRACE_LOG_MAX_BYTES = 5 * 1024 * 1024
+TRACE_LOG_BACKUPS = 3
+TRACE_HISTORY = 50
+TRACE_MAX_SPANS = 200
+
+class Action:
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.time()
+        self._t0 = time.perf_counter()
+        self.total_ms: Optional[float] = None
+        self.spans: List[Tuple[str, str, float]] = []
+        self.queries = 0
+        self._open = 1
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, name: str, ms: float):
+        with self._lock:
+            if kind == "query":
+                self.queries += 1
+            self.spans.append((kind, name, ms))
+
+    def hold(self):
+        with self._lock:
+            self._open += 1
+
+    def release(self):
+        with self._lock:
+            self._open -= 1
+            if self._open:
+                return
+            self.total_ms = (time.perf_counter() - self._t0) * 1000
+        tracer.finish(self)
+
+    def breakdown(self) -> Dict[str, float]:
+        out: Dict[str, float] = {}
+        for kind, _, ms in self.spans:
+            out[kind] = out.get(kind, 0.0) + ms
+        return out
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "type": "action",
+            "action": self.name,
+            "started": datetime.fromtimestamp(self.started).isoformat(timespec="milliseconds"),
+            "total_ms": round(self.total_ms or 0.0, 3),
+            "queries": self.queries,
+            "breakdown_ms": {k: round(v, 3) for k, v in self.breakdown().items()},
+            "spans": [[kind, name, round(ms, 3)] for kind, name, ms in self.spans[:TRACE_MAX_SPANS]]
+        }
 
-def get_connection():
-    conn = pymysql.connect(host=DB_HOST, user=DB_USER, password=DB_PASS, charset='utf8mb4', autocommit=False)
-    cur = conn.cursor()
-    cur.execute(f"CREATE DATABASE IF NOT EXISTS {DB_NAME}")
-    cur.execute(f"USE {DB_NAME}")
+class Tracer:
+    def __init__(self):
+        self._local = threading.local()
+        self.history = deque(maxlen=TRACE_HISTORY)
+        self.listeners: List[Callable[[Action], None]] = []
+        self._logger = None
+        self._log_lock = threading.Lock()
+
+    def current(self) -> Optional[Action]:
+        return getattr(self._local, "action", None)
+
+    @contextmanager
+    def activate(self, action: Optional[Action]):
+        previous = self.current()
+        self._local.action = action
+        try:
+            yield action
+        finally:
+            self._local.action = previous
+
+    @contextmanager
+    def action(self, name: str):
+        outer = self.current()
+        if outer is not None:
+            yield outer
+            return
+        act = Action(name)
+        try:
+            with self.activate(act):
+                yield act
+        finally:
+            act.release()
+
+    def bind(self, action: Optional[Action], fn: Optional[Callable]) -> Optional[Callable]:
+        if action is None or fn is None:
+            return fn
+
+        def call(*args):
+            with self.activate(action):
+                return fn(*args)
+        return call
+
+    @contextmanager
+    def span(self, kind: str, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(kind, name, (time.perf_counter() - t0) * 1000)
+
+    def record(self, kind: str, name: str, ms: float):
+        act = self.current()
+        if act is not None:
+            act.record(kind, name, ms)
+        if kind == "query" and ms >= SLOW_QUERY_MS:
+            self.write({"type": "slow_query", "query": name, "ms": round(ms, 3),
+                        "action": act.name if act is not None else None,
+                        "at": datetime.now().isoformat(timespec="milliseconds")})
+
+    def finish(self, action: Action):
+        self.history.append(action)
+        self.write(action.to_record())
+        for listener in list(self.listeners):
+            listener(action)
+
+    def write(self, record: Dict[str, Any]):
+        if not TRACE_LOG_PATH:
+            return
+        with self._log_lock:
+            if self._logger is None:
+                logger = logging.getLogger("shs.trace")
+                logger.propagate = False
+                logger.setLevel(logging.INFO)
+                handler = logging.handlers.RotatingFileHandler(
+                    TRACE_LOG_PATH, maxBytes=TRACE_LOG_MAX_BYTES, backupCount=TRACE_LOG_BACKUPS, encoding="utf-8")
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                logger.addHandler(handler)
+                self._logger = logger
+        self._logger.info(json.dumps(record, default=str))
+
+tracer = Tracer()
+
+def _sql_label(sql: str) -> str:
+    return " ".join(sql.split())[:160]
+
+class _TracedCursor:
+    def __init__(self, cur):
+        self._cur = cur
+        self.raw = cur
+
+    def execute(self, sql: str, *args):
+        with tracer.span("query", _sql_label(sql)):
+            return self._cur.execute(sql, *args)
+
+    def executemany(self, sql: str, *args):
+        with tracer.span("query", _sql_label(sql)):
+            return self._cur.executemany(sql, *args)
+
+    def __getattr__(self, name):
+        return getattr(self._cur, name)
+
+class _TracedConnection:
+    def __init__(self, conn):
+        self._conn = conn
+
+    def cursor(self, *args, **kwargs):
+        return _TracedCursor(self._conn.cursor(*args, **kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+LATENCY_BUCKETS_MS = tuple(round(0.05 * 1.5 ** i, 3) for i in range(32))
+
+class LatencyHistogram:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            self.count = 0
+            self.total_ms = 0.0
+            self.max_ms = 0.0
+
+    def observe(self, ms: float):
+        with self._lock:
+            self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+            self.count += 1
+            self.total_ms += ms
+            self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, p: float) -> float:
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, round(self.count * p / 100))
+            seen = 0
+            for i, n in enumerate(self.counts):
+                seen += n
+                if seen >= rank:
+                    # upper bucket bound, capped by the slowest sample actually seen
+                    return min(LATENCY_BUCKETS_MS[i], self.max_ms) if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+            return self.max_ms
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(self.max_ms, 3)
+        }
+
+class Statement:
+    def __init__(self, name: str, sql: str, rows: str = "tuple"):
+        self.name = name
+        self.sql = sql
+        self.rows = rows
+        self.latency = LatencyHistogram()
+
+    def render(self, parts: Dict[str, str]) -> str:
+        return self.sql.format(**parts) if parts else self.sql
+
+STATEMENTS: Dict[str, Statement] = {}
+
+def statement(name: str, sql: str, rows: str = "tuple") -> Statement:
+    if rows not in ("tuple", "dict", "stream"):
+        raise ValueError(f"Unknown row shape {rows!r} for statement {name}")
+    st = STATEMENTS[name] = Statement(name, sql, rows)
+    return st
+
+def _placeholders(count: int) -> str:
+    return ",".join(["%s"] * count)
+
+def _run_statement(cur, st: Statement, method: str, params, parts: Dict[str, str]):
+    sql = st.render(parts)
+    raw = cur.raw if isinstance(cur, _TracedCursor) else cur
+    t0 = time.perf_counter()
+    try:
+        getattr(raw, method)(sql, params)
+    finally:
+        ms = (time.perf_counter() - t0) * 1000
+        st.latency.observe(ms)
+        tracer.record("query", st.name, ms)
+    return cur
+
+def _statement_cursor(conn, st: Statement):
+    if st.rows == "dict":
+        return get_backend().dict_cursor(conn)
+    if st.rows == "stream":
+        return get_backend().stream_cursor(conn)
+    return conn.cursor()
+
+def query(conn, name: str, params=(), **parts):
+    st = STATEMENTS[name]
+    return _run_statement(_statement_cursor(conn, st), st, "execute", params, parts)
+
+def query_many(conn, name: str, seq, **parts):
+    st = STATEMENTS[name]
+    return _run_statement(_statement_cursor(conn, st), st, "executemany", seq, parts)
+
+def fetch_all(conn, name: str, params=(), **parts) -> list:
+    return query(conn, name, params, **parts).fetchall()
+
+def fetch_one(conn, name: str, params=(), **parts):
+    return query(conn, name, params, **parts).fetchone()
+
+def fetch_value(conn, name: str, params=(), default=None, **parts):
+    row = fetch_one(conn, name, params, **parts)
+    if not row:
+        return default
+    return row[0] if isinstance(row, (list, tuple)) else next(iter(row.values()))
+
+def query_stats() -> List[Dict[str, Any]]:
+    rows = [{"statement": st.name, **st.latency.summary()} for st in STATEMENTS.values() if st.latency.count]
+    rows.sort(key=lambda r: r["total_ms"], reverse=True)
+    return rows
+
+def reset_query_stats():
+    for st in STATEMENTS.values():
+        st.latency.reset()
+
+class PoolTimeout(Exception):
+    pass
+
+class ConnectionPool:
+    def __init__(self, factory: Callable[[], Any], max_size: int = POOL_SIZE,
+                 timeout: float = POOL_TIMEOUT, idle_check: float = POOL_IDLE_CHECK):
+        self._factory = factory
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_check = idle_check
+        self._idle = []
+        self._size = 0
+        self._cond = threading.Condition()
+        self._stats = {"checkouts": 0, "waits": 0, "reconnects": 0, "created": 0, "discarded": 0}
+
+    def _close_quietly(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _open(self):
+        try:
+            conn = self._factory()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats["created"] += 1
+        return conn
+
+    def acquire(self):
+        with self._cond:
+            self._stats["checkouts"] += 1
+            deadline = time.monotonic() + self.timeout
+            waited = False
+            while not self._idle and self._size >= self.max_size:
+                if not waited:
+                    self._stats["waits"] += 1
+                    waited = True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeout(f"No database connection available after {self.timeout:g}s")
+                self._cond.wait(remaining)
+            if self._idle:
+                conn, last_used = self._idle.pop()
+            else:
+                self._size += 1
+                conn, last_used = None, None
+        if conn is None:
+            return self._open()
+        if time.monotonic() - last_used > self.idle_check:
+            try:
+                conn.ping(reconnect=False)
+            except Exception:
+                self._close_quietly(conn)
+                with self._cond:
+                    self._stats["reconnects"] += 1
+                return self._open()
+        return conn
+
+    def release(self, conn, discard: bool = False):
+        if not discard:
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+        with self._cond:
+            if discard:
+                self._size -= 1
+                self._stats["discarded"] += 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+        if discard:
+            self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        discard = False
+        try:
+            yield _TracedConnection(conn)
+        except _DISCONNECT_ERRORS:
+            discard = True
+            raise
+        finally:
+            self.release(conn, discard=discard)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            out = dict(self._stats)
+            out["size"] = self._size
+            out["idle"] = len(self._idle)
+            out["max_size"] = self.max_size
+        return out
+
+    def close(self):
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+def _migration_001_base_tables(cur):
     cur.execute("""
         CREATE TABLE IF NOT EXISTS users (
             id INT AUTO_INCREMENT PRIMARY KEY,
@@ -50,101 +469,1339 @@ def get_connection():
             submitted_role VARCHAR(50)
         )
     """)
-    conn.commit()
-    return conn
 
-def load_students_from_db() -> List[Dict[str, Any]]:
-    conn = get_connection()
-    cur = conn.cursor(pymysql.cursors.DictCursor)
-    cur.execute("SELECT * FROM students")
+def _parse_student_number(sid) -> int:
+    if sid and isinstance(sid, str) and sid.startswith("SID-"):
+        try:
+            return int(sid.split("-")[1])
+        except Exception:
+            pass
+    return 0
+
+def _migration_002_student_id_sequence(cur):
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS sequences (
+            name VARCHAR(50) PRIMARY KEY,
+            value BIGINT NOT NULL
+        )
+    """)
+    cur.execute("UPDATE students SET student_id = NULL WHERE student_id = ''")
+    cur.execute("SELECT id, student_id FROM students WHERE student_id IS NOT NULL ORDER BY id")
     rows = cur.fetchall()
-    conn.close()
-    return rows
+    maxn = max((_parse_student_number(sid) for _, sid in rows), default=0)
+    seen = set()
+    for row_id, sid in rows:
+        if sid in seen:
+            maxn += 1
+            cur.execute("UPDATE students SET student_id = %s WHERE id = %s", (f"SID-{maxn:04d}", row_id))
+        else:
+            seen.add(sid)
+    cur.execute("INSERT INTO sequences (name, value) VALUES ('student_id', %s) "
+                "ON DUPLICATE KEY UPDATE value = GREATEST(value, VALUES(value))", (maxn,))
+    cur.execute("ALTER TABLE students ADD UNIQUE INDEX uq_students_student_id (student_id)")
+
+STATUSES = ("pending", "approved", "declined")
+GENDERS = ("Male", "Female")
+SEMESTERS = ("1st Semester", "2nd Semester")
+STRANDS = ("STEM", "ABM", "GAS", "HUMSS", "TVL", "Arts and Design Track")
+SCHOOL_YEARS = ("2025 - 2026", "2026 - 2027")
+GUARDIAN_RELATIONS = ("Father", "Mother", "Legal Guardian", "Others")
+DATE_OF_BIRTH_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y", "%Y/%m/%d", "%B %d, %Y", "%b %d, %Y", "%d %B %Y", "%d %b %Y")
+
+def parse_date_of_birth(text) -> Optional[date]:
+    if isinstance(text, date):
+        return text
+    text = (text or "").strip()
+    for fmt in DATE_OF_BIRTH_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            pass
+    return None
+
+def _enum_sql(values: Tuple[str, ...]) -> str:
+    return "ENUM(" + ", ".join(f"'{v}'" for v in values) + ")"
+
+def _migration_003_typed_columns_and_indexes(cur):
+    cur.execute("ALTER TABLE students ADD COLUMN dob_date DATE NULL AFTER date_of_birth, "
+                "ADD COLUMN date_of_birth_raw VARCHAR(20) NULL AFTER dob_date")
+    cur.execute("SELECT id, date_of_birth FROM students WHERE date_of_birth IS NOT NULL AND date_of_birth <> ''")
+    parsed, unparsed = [], []
+    for row_id, text in cur.fetchall():
+        d = parse_date_of_birth(text)
+        if d is not None:
+            parsed.append((d, row_id))
+        else:
+            unparsed.append((text, row_id))
+    if parsed:
+        cur.executemany("UPDATE students SET dob_date = %s WHERE id = %s", parsed)
+    if unparsed:
+        cur.executemany("UPDATE students SET date_of_birth_raw = %s WHERE id = %s", unparsed)
+    cur.execute("ALTER TABLE students DROP COLUMN date_of_birth")
+    cur.execute("ALTER TABLE students CHANGE COLUMN dob_date date_of_birth DATE NULL AFTER last_name")
+
+    cur.execute(f"UPDATE students SET status = 'pending' WHERE status IS NULL OR status NOT IN {STATUSES}")
+    cur.execute(f"UPDATE students SET gender = NULL WHERE gender NOT IN {GENDERS}")
+    cur.execute(f"UPDATE students SET semester = NULL WHERE semester NOT IN {SEMESTERS}")
+    cur.execute(f"""
+        ALTER TABLE students
+            MODIFY status {_enum_sql(STATUSES)} NOT NULL DEFAULT 'pending',
+            MODIFY gender {_enum_sql(GENDERS)} NULL,
+            MODIFY semester {_enum_sql(SEMESTERS)} NULL,
+            ADD INDEX ix_students_status (status),
+            ADD INDEX ix_students_strand_year (strand, school_year),
+            ADD INDEX ix_students_email (email),
+            ADD INDEX ix_students_name (last_name, first_name)
+    """)
 
-def save_students_to_db(data: List[Dict[str, Any]]):
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM students")
-    for s in data:
-        guardian_name = None
-        guardian_relation = None
-        previous_school = None
-        if s.get("guardian"):
-            guardian_name = s["guardian"].get("name") if s["guardian"].get("name") not in (None, "") else None
-            guardian_relation = s["guardian"].get("relation") if s["guardian"].get("relation") not in (None, "") else None
-        if s.get("academic"):
-            previous_school = s["academic"].get("previous_school") if s["academic"].get("previous_school") not in (None, "") else None
-
-        cur.execute("""
-            INSERT INTO students (student_id, first_name, last_name, date_of_birth, gender, email, phone, status,
-                                  guardian_name, guardian_relation, previous_school, strand, semester, school_year,
-                                  submitted_by, submitted_role)
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-        """, (
-            s.get("student_id"), s.get("first_name"), s.get("last_name"), s.get("date_of_birth"),
-            s.get("gender"), s.get("email"), s.get("phone"), s.get("status"),
-            guardian_name, guardian_relation,
-            previous_school, s.get("academic", {}).get("strand"), s.get("academic", {}).get("semester"), s.get("academic", {}).get("school_year"),
-            s.get("submitted_by"), s.get("submitted_role")
-        ))
-    conn.commit()
-    conn.close()
-
-def generate_student_id() -> str:
-    conn = get_connection()
+def _migration_004_students_version(cur):
+    cur.execute("ALTER TABLE students ADD COLUMN row_version BIGINT NOT NULL DEFAULT 0, "
+                "ADD INDEX ix_students_row_version (row_version)")
+    cur.execute("INSERT INTO sequences (name, value) VALUES ('students_version', 0) "
+                "ON DUPLICATE KEY UPDATE value = value")
+
+def _migration_005_change_log(cur):
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS student_changes (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            version BIGINT NOT NULL,
+            student_pk INT NOT NULL,
+            op ENUM('insert', 'update', 'reset') NOT NULL,
+            changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            INDEX ix_student_changes_version (version),
+            INDEX ix_student_changes_changed_at (changed_at)
+        )
+    """)
+
+PASSWORD_SCHEME = "pbkdf2_sha256"
+PASSWORD_ITERATIONS = 600_000
+PASSWORD_SALT_BYTES = 16
+DEFAULT_USERS = (("admin", "admin123", "admin"), ("staff", "staff123", "staff"))
+
+def hash_password(password: str, iterations: int = PASSWORD_ITERATIONS) -> str:
+    salt = secrets.token_bytes(PASSWORD_SALT_BYTES)
+    derived = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+    return "$".join((PASSWORD_SCHEME, str(iterations),
+                     base64.b64encode(salt).decode("ascii"), base64.b64encode(derived).decode("ascii")))
+
+def is_password_hash(stored: Optional[str]) -> bool:
+    return bool(stored) and stored.startswith(PASSWORD_SCHEME + "$")
+
+def password_needs_rehash(stored: str) -> bool:
+    if not is_password_hash(stored):
+        return True
+    return int(stored.split("$")[1]) < PASSWORD_ITERATIONS
+
+def verify_password(password: str, stored: str) -> bool:
+    try:
+        scheme, iterations, salt, expected = stored.split("$")
+        salt_bytes, expected_bytes = base64.b64decode(salt), base64.b64decode(expected)
+        iterations = int(iterations)
+    except (ValueError, TypeError):
+        return False
+    if scheme != PASSWORD_SCHEME:
+        return False
+    derived = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt_bytes, iterations)
+    return hmac.compare_digest(derived, expected_bytes)
+
+_dummy_password_hash: Optional[str] = None
+
+def _seed_default_users(cur):
+    cur.execute("SELECT COUNT(*) FROM users")
+    if cur.fetchone()[0] == 0:
+        cur.executemany("INSERT INTO users (username, password, role) VALUES (%s, %s, %s)",
+                        [(username, hash_password(password), role) for username, password, role in DEFAULT_USERS])
+
+def _migration_006_password_hashes(cur):
+    cur.execute("ALTER TABLE users MODIFY password VARCHAR(255)")
+    _seed_default_users(cur)
+
+MIGRATIONS: List[Tuple[int, Callable[[Any], None]]] = [
+    (1, _migration_001_base_tables),
+    (2, _migration_002_student_id_sequence),
+    (3, _migration_003_typed_columns_and_indexes),
+    (4, _migration_004_students_version),
+    (5, _migration_005_change_log),
+    (6, _migration_006_password_hashes),
+]
+
+def _sqlite_migration_001_schema(cur):
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE,
+            password TEXT,
+            role TEXT
+        )
+    """)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS students (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id TEXT UNIQUE,
+            first_name TEXT,
+            last_name TEXT,
+            date_of_birth TEXT,
+            date_of_birth_raw TEXT,
+            gender TEXT CHECK (gender IN {GENDERS}),
+            email TEXT,
+            phone TEXT,
+            status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN {STATUSES}),
+            guardian_name TEXT,
+            guardian_relation TEXT,
+            previous_school TEXT,
+            strand TEXT,
+            semester TEXT CHECK (semester IN {SEMESTERS}),
+            school_year TEXT,
+            submitted_by TEXT,
+            submitted_role TEXT,
+            row_version INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS ix_students_status ON students (status)")
+    cur.execute("CREATE INDEX IF NOT EXISTS ix_students_strand_year ON students (strand, school_year)")
+    cur.execute("CREATE INDEX IF NOT EXISTS ix_students_email ON students (email)")
+    cur.execute("CREATE INDEX IF NOT EXISTS ix_students_name ON students (last_name, first_name)")
+    cur.execute("CREATE INDEX IF NOT EXISTS ix_students_row_version ON students (row_version)")
+    cur.execute("CREATE TABLE IF NOT EXISTS sequences (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+    cur.execute("INSERT OR IGNORE INTO sequences (name, value) VALUES ('student_id', 0), ('students_version', 0)")
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS student_changes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            version INTEGER NOT NULL,
+            student_pk INTEGER NOT NULL,
+            op TEXT NOT NULL CHECK (op IN ('insert', 'update', 'reset')),
+            changed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS ix_student_changes_version ON student_changes (version)")
+    cur.execute("CREATE INDEX IF NOT EXISTS ix_student_changes_changed_at ON student_changes (changed_at)")
+
+SQLITE_MIGRATIONS: List[Tuple[int, Callable[[Any], None]]] = [
+    (1, _sqlite_migration_001_schema),
+    (2, _seed_default_users),
+]
+
+CHANGE_LOG_RETENTION_DAYS = 7
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+def _run_migrations(conn, migrations: List[Tuple[int, Callable[[Any], None]]]):
     cur = conn.cursor()
-    cur.execute("SELECT student_id FROM students")
-    ids = cur.fetchall()
-    maxn = 0
-    for row in ids:
-        sid = row[0] if isinstance(row, (list, tuple)) else row
-        if sid and isinstance(sid, str) and sid.startswith("SID-"):
+    cur.execute("CREATE TABLE IF NOT EXISTS schema_version (version INT PRIMARY KEY)")
+    cur.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+    current = cur.fetchone()[0]
+    for version, migrate in migrations:
+        if version <= current:
+            continue
+        migrate(cur)
+        cur.execute("INSERT INTO schema_version (version) VALUES (%s)", (version,))
+        conn.commit()
+
+class StorageBackend(ABC):
+    name = ""
+    max_bind_params = 999
+
+    @abstractmethod
+    def connect(self):
+        ...
+
+    @abstractmethod
+    def ensure_schema(self):
+        ...
+
+    @abstractmethod
+    def next_sequence_value(self, conn, name: str, count: int) -> int:
+        ...
+
+    @abstractmethod
+    def dict_cursor(self, conn):
+        ...
+
+    @abstractmethod
+    def stream_cursor(self, conn):
+        ...
+
+    @abstractmethod
+    def concat(self, *parts: str) -> str:
+        ...
+
+    @abstractmethod
+    def like(self, expr: str) -> str:
+        ...
+
+statement("sequences.advance.mysql", "UPDATE sequences SET value = LAST_INSERT_ID(value + %s) WHERE name = %s")
+statement("sequences.last_insert_id.mysql", "SELECT LAST_INSERT_ID()")
+
+class MySQLBackend(StorageBackend):
+    name = "mysql"
+    # pymysql interpolates client-side; this keeps an id lookup well under the default max_allowed_packet
+    max_bind_params = 65535
+
+    def connect(self):
+        return _connect(DB_NAME)
+
+    def ensure_schema(self):
+        conn = _connect(database=None)
+        try:
+            cur = conn.cursor()
+            cur.execute(f"CREATE DATABASE IF NOT EXISTS {DB_NAME}")
+            cur.execute(f"USE {DB_NAME}")
+            cur.execute("SELECT GET_LOCK(%s, 60)", (f"{DB_NAME}.migrate",))
             try:
-                n = int(sid.split("-")[1])
-                maxn = max(maxn, n)
-            except Exception:
-                pass
-    conn.close()
-    return f"SID-{maxn+1:04d}"
+                _run_migrations(conn, MIGRATIONS)
+                cur.execute("DELETE FROM student_changes WHERE changed_at < NOW() - INTERVAL %s DAY",
+                            (CHANGE_LOG_RETENTION_DAYS,))
+                conn.commit()
+            finally:
+                cur.execute("SELECT RELEASE_LOCK(%s)", (f"{DB_NAME}.migrate",))
+        finally:
+            conn.close()
 
-def load_students_from_file() -> List[Dict[str, Any]]:
-    rows = load_students_from_db()
-    out = []
-    for r in rows:
-        out.append({
-            "student_id": r.get("student_id"),
-            "first_name": r.get("first_name"),
-            "last_name": r.get("last_name"),
-            "date_of_birth": r.get("date_of_birth"),
-            "gender": r.get("gender"),
-            "email": r.get("email"),
-            "phone": r.get("phone"),
-            "status": r.get("status") or "pending",
-            "guardian": {
-                "name": r.get("guardian_name") if r.get("guardian_name") is not None else None,
-                "relation": r.get("guardian_relation") if r.get("guardian_relation") is not None else None,
-                "phone": ""
-            },
-            "academic": {
-                "previous_school": r.get("previous_school") if r.get("previous_school") is not None else None,
-                "strand": r.get("strand") or "",
-                "semester": r.get("semester") or "",
-                "school_year": r.get("school_year") or ""
-            },
-            "submitted_by": r.get("submitted_by") or "",
-            "submitted_role": r.get("submitted_role") or ""
-        })
+    def next_sequence_value(self, conn, name: str, count: int) -> int:
+        query(conn, "sequences.advance.mysql", (count, name))
+        return int(fetch_value(conn, "sequences.last_insert_id.mysql"))
+
+    def dict_cursor(self, conn):
+        return conn.cursor(pymysql.cursors.DictCursor)
+
+    def stream_cursor(self, conn):
+        return conn.cursor(pymysql.cursors.SSCursor)
+
+    def concat(self, *parts: str) -> str:
+        return f"CONCAT({', '.join(parts)})"
+
+    def like(self, expr: str) -> str:
+        return f"LOWER({expr}) LIKE %s COLLATE utf8mb4_bin"
+
+def _sqlite_dict_row(cur, row):
+    return {d[0]: v for d, v in zip(cur.description, row)}
+
+@lru_cache(maxsize=512)
+def _qmark(sql: str) -> str:
+    return sql.replace("%s", "?")
+
+class _SQLiteCursor:
+    def __init__(self, cur):
+        self._cur = cur
+
+    def execute(self, sql: str, params=()):
+        self._cur.execute(_qmark(sql), tuple(params))
+        return self._cur.rowcount
+
+    def executemany(self, sql: str, seq):
+        self._cur.executemany(_qmark(sql), seq)
+        return self._cur.rowcount
+
+    def fetchone(self):
+        return self._cur.fetchone()
+
+    def fetchall(self):
+        return self._cur.fetchall()
+
+    def fetchmany(self, size: int):
+        return self._cur.fetchmany(size)
+
+    @property
+    def rowcount(self) -> int:
+        return self._cur.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cur.lastrowid
+
+    @property
+    def description(self):
+        return self._cur.description
+
+    def close(self):
+        self._cur.close()
+
+class _SQLiteConnection:
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def cursor(self, dict_rows: bool = False) -> _SQLiteCursor:
+        cur = self._conn.cursor()
+        if dict_rows:
+            cur.row_factory = _sqlite_dict_row
+        return _SQLiteCursor(cur)
+
+    def ping(self, reconnect: bool = False):
+        self._conn.execute("SELECT 1")
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        self._conn.close()
+
+sqlite3.register_adapter(date, date.isoformat)
+
+# sqlite3 keeps compiled statements per connection keyed by SQL text; size it to hold every registered statement
+SQLITE_STATEMENT_CACHE = 256
+
+statement("sequences.advance.sqlite", "UPDATE sequences SET value = value + %s WHERE name = %s")
+statement("sequences.current", "SELECT value FROM sequences WHERE name = %s")
+
+class SQLiteBackend(StorageBackend):
+    name = "sqlite"
+    # SQLITE_MAX_VARIABLE_NUMBER: 999 before 3.32, 32766 after
+    max_bind_params = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+    def connect(self):
+        conn = sqlite3.connect(SQLITE_PATH, timeout=POOL_TIMEOUT, check_same_thread=False,
+                               cached_statements=SQLITE_STATEMENT_CACHE)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # SQLite's LOWER() only folds ASCII; match the str.lower() the search text goes through
+        conn.create_function("py_lower", 1, lambda s: s.lower() if s is not None else None, deterministic=True)
+        return _SQLiteConnection(conn)
+
+    def ensure_schema(self):
+        conn = self.connect()
+        try:
+            _run_migrations(conn, SQLITE_MIGRATIONS)
+            conn.cursor().execute("DELETE FROM student_changes WHERE changed_at < datetime('now', %s)",
+                                  (f"-{CHANGE_LOG_RETENTION_DAYS} days",))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def next_sequence_value(self, conn, name: str, count: int) -> int:
+        # the UPDATE takes SQLite's write lock, so the read-back cannot interleave with another writer
+        query(conn, "sequences.advance.sqlite", (count, name))
+        return int(fetch_value(conn, "sequences.current", (name,)))
+
+    def dict_cursor(self, conn):
+        return conn.cursor(dict_rows=True)
+
+    def stream_cursor(self, conn):
+        return conn.cursor()
+
+    def concat(self, *parts: str) -> str:
+        return "(" + " || ".join(parts) + ")"
+
+    def like(self, expr: str) -> str:
+        return f"py_lower({expr}) LIKE %s ESCAPE '\\'"
+
+BACKENDS = {"mysql": MySQLBackend, "sqlite": SQLiteBackend}
+_backend: Optional[StorageBackend] = None
+
+def get_backend() -> StorageBackend:
+    global _backend
+    if _backend is None or _backend.name != DB_BACKEND:
+        cls = BACKENDS.get(DB_BACKEND)
+        if cls is None:
+            raise ValueError(f"Unknown DB_BACKEND {DB_BACKEND!r}; expected one of: {', '.join(BACKENDS)}")
+        _backend = cls()
+    return _backend
+
+def ensure_schema():
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if _schema_ready:
+            return
+        get_backend().ensure_schema()
+        _schema_ready = True
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool() -> ConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                ensure_schema()
+                _pool = ConnectionPool(get_backend().connect)
+    return _pool
+
+def get_connection():
+    return get_pool().connection()
+
+def pool_stats() -> Dict[str, int]:
+    return get_pool().stats()
+
+def reset_data_layer():
+    global _pool, _schema_ready, _search_index, _backend
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = None
+        _schema_ready = False
+        _backend = None
+    _search_index = None
+    _student_details.clear()
+    invalidate_dashboard_stats()
+
+statement("students.all", "SELECT * FROM students ORDER BY id", rows="dict")
+statement("students.by_id", "SELECT * FROM students WHERE id = %s", rows="dict")
+# the table only shows these; the wide row is fetched by primary key when a student is selected
+_LIST_COLUMNS = "id, student_id, first_name, last_name, status"
+statement("students.by_ids", f"SELECT {_LIST_COLUMNS} FROM students WHERE id IN ({{ids}})", rows="dict")
+statement("students.filtered", f"SELECT {_LIST_COLUMNS} FROM students{{where}} ORDER BY id", rows="dict")
+statement("students.page", f"SELECT {_LIST_COLUMNS} FROM students{{where}} ORDER BY id LIMIT %s", rows="dict")
+statement("students.count", "SELECT COUNT(*) FROM students{where}")
+
+def load_students_from_db() -> List[Dict[str, Any]]:
+    with get_connection() as conn:
+        return fetch_all(conn, "students.all")
+
+STUDENT_COLUMNS = (
+    "student_id", "first_name", "last_name", "date_of_birth", "date_of_birth_raw", "gender", "email", "phone",
+    "status", "guardian_name", "guardian_relation", "previous_school", "strand", "semester", "school_year",
+    "submitted_by", "submitted_role"
+)
+
+@dataclass(frozen=True, slots=True)
+class Guardian:
+    name: Optional[str] = None
+    relation: Optional[str] = None
+    phone: str = ""
+
+@dataclass(frozen=True, slots=True)
+class Academic:
+    previous_school: Optional[str] = None
+    strand: str = ""
+    semester: str = ""
+    school_year: str = ""
+
+class _StudentNames:
+    __slots__ = ()
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name or ''} {self.last_name or ''}"
+
+    @property
+    def initials(self) -> str:
+        return ((self.first_name or " ")[0:1] + (self.last_name or " ")[0:1]).upper()
+
+    @property
+    def display_id(self) -> str:
+        return self.student_id or f"SID-{self.id:04d}"
+
+@dataclass(slots=True)
+class StudentSummary(_StudentNames):
+    id: int
+    student_id: Optional[str]
+    first_name: str
+    last_name: str
+    status: str
+
+@dataclass(slots=True)
+class Student(_StudentNames):
+    id: Optional[int] = None
+    student_id: Optional[str] = None
+    first_name: str = ""
+    last_name: str = ""
+    date_of_birth: str = ""
+    gender: Optional[str] = None
+    email: str = ""
+    phone: str = ""
+    status: str = "pending"
+    guardian: Guardian = field(default_factory=Guardian)
+    academic: Academic = field(default_factory=Academic)
+    submitted_by: str = ""
+    submitted_role: str = ""
+
+def _flatten_student(s) -> Dict[str, Any]:
+    if isinstance(s, Student):
+        s = asdict(s)
+    out = {k: v for k, v in s.items() if k in STUDENT_COLUMNS}
+    g = s.get("guardian")
+    if g:
+        if "name" in g:
+            out["guardian_name"] = g.get("name") if g.get("name") not in (None, "") else None
+        if "relation" in g:
+            out["guardian_relation"] = g.get("relation") if g.get("relation") not in (None, "") else None
+    a = s.get("academic")
+    if a:
+        if "previous_school" in a:
+            out["previous_school"] = a.get("previous_school") if a.get("previous_school") not in (None, "") else None
+        for k in ("strand", "semester", "school_year"):
+            if k in a:
+                out[k] = a.get(k)
+    if "date_of_birth" in out:
+        raw = out["date_of_birth"]
+        out["date_of_birth"] = parse_date_of_birth(raw)
+        out["date_of_birth_raw"] = None if out["date_of_birth"] is not None or raw in (None, "") else raw
+    for k in ("gender", "semester"):
+        if k in out and out[k] == "":
+            out[k] = None
     return out
 
+def _student_row(s: Dict[str, Any]) -> tuple:
+    flat = _flatten_student(s)
+    if not flat.get("status"):
+        flat["status"] = "pending"
+    return tuple(flat.get(c) for c in STUDENT_COLUMNS)
+
+statement("students.insert", f"INSERT INTO students ({', '.join(STUDENT_COLUMNS)}, row_version) "
+                             f"VALUES ({_placeholders(len(STUDENT_COLUMNS) + 1)})")
+statement("students.update", "UPDATE students SET {assignments}, row_version=%s WHERE id=%s")
+statement("students.delete_all", "DELETE FROM students")
+statement("students.set_status", "UPDATE students SET status=%s, row_version=%s WHERE id IN ({ids})")
+statement("students.ids_by_student_id", "SELECT id, student_id FROM students WHERE student_id IN ({sids})")
+statement("student_changes.insert", "INSERT INTO student_changes (version, student_pk, op) VALUES (%s, %s, %s)")
+statement("student_changes.since", "SELECT version, student_pk, op FROM student_changes WHERE version > %s "
+                                   "ORDER BY version, id LIMIT %s")
+
+def _next_sequence_value(conn, name: str, count: int = 1) -> int:
+    return get_backend().next_sequence_value(conn, name, count)
+
+def _bump_students_version(conn) -> int:
+    return _next_sequence_value(conn, "students_version")
+
+def students_version(conn) -> int:
+    return int(fetch_value(conn, "sequences.current", ("students_version",), default=0))
+
+def _log_changes(conn, version: int, op: str, row_ids: List[int]):
+    query_many(conn, "student_changes.insert", [(version, row_id, op) for row_id in row_ids])
+
+def save_students_to_db(data: List[Dict[str, Any]]):
+    with get_connection() as conn:
+        version = _bump_students_version(conn)
+        query(conn, "students.delete_all")
+        query_many(conn, "students.insert", [(*_student_row(s), version) for s in data])
+        _log_changes(conn, version, "reset", [0])
+        conn.commit()
+    _student_details.clear()
+    invalidate_dashboard_stats()
+
+def insert_student(student: Dict[str, Any]) -> int:
+    with get_connection() as conn:
+        if not student.get("student_id"):
+            student["student_id"] = _allocate_student_ids(conn)[0]
+        version = _bump_students_version(conn)
+        row = _student_row(student)
+        student["id"] = query(conn, "students.insert", (*row, version)).lastrowid
+        _log_changes(conn, version, "insert", [student["id"]])
+        conn.commit()
+    invalidate_dashboard_stats()
+    if _search_index is not None:
+        _search_index.add(_student_from_row({**dict(zip(STUDENT_COLUMNS, row)), "id": student["id"]}), version)
+    return student["id"]
+
+def update_student(row_id: int, fields: Dict[str, Any]) -> bool:
+    flat = _flatten_student(fields)
+    if not flat:
+        return False
+    assignments = ", ".join(f"{c}=%s" for c in flat)
+    with get_connection() as conn:
+        version = _bump_students_version(conn)
+        cur = query(conn, "students.update", (*flat.values(), version, row_id), assignments=assignments)
+        found = cur.rowcount > 0
+        _log_changes(conn, version, "update", [row_id])
+        conn.commit()
+    _student_details.discard([row_id])
+    invalidate_dashboard_stats()
+    if found and _search_index is not None:
+        if set(flat) == {"status"}:
+            _search_index.set_status(row_id, flat["status"], version)
+        else:
+            _reindex_students("id = %s", (row_id,))
+    return found
+
+def update_student_status(row_id: int, status: str) -> bool:
+    return update_student(row_id, {"status": status})
+
+BULK_UPDATE_CHUNK = 500
+
+def set_students_status(row_ids: List[int], status: str) -> int:
+    if status not in STATUSES:
+        raise ValueError(f"Unknown status {status!r}")
+    row_ids = sorted(set(row_ids))
+    if not row_ids:
+        return 0
+    updated = 0
+    with get_connection() as conn:
+        version = _bump_students_version(conn)
+        for i in range(0, len(row_ids), BULK_UPDATE_CHUNK):
+            chunk = row_ids[i:i + BULK_UPDATE_CHUNK]
+            updated += query(conn, "students.set_status", (status, version, *chunk),
+                             ids=_placeholders(len(chunk))).rowcount
+        _log_changes(conn, version, "update", row_ids)
+        conn.commit()
+    _student_details.discard(row_ids)
+    index = _search_index
+    if index is not None:
+        for row_id in row_ids:
+            index.set_status(row_id, status, version)
+    invalidate_dashboard_stats()
+    return updated
+
+def insert_students(students: List[Dict[str, Any]]) -> List[int]:
+    if not students:
+        return []
+    with get_connection() as conn:
+        missing = [s for s in students if not s.get("student_id")]
+        if missing:
+            for s, sid in zip(missing, _allocate_student_ids(conn, len(missing))):
+                s["student_id"] = sid
+        version = _bump_students_version(conn)
+        query_many(conn, "students.insert", [(*_student_row(s), version) for s in students])
+        sids = [s["student_id"] for s in students]
+        id_of = {sid: pk for pk, sid in fetch_all(conn, "students.ids_by_student_id", sids,
+                                                  sids=_placeholders(len(sids)))}
+        for s in students:
+            s["id"] = id_of[s["student_id"]]
+        _log_changes(conn, version, "insert", [s["id"] for s in students])
+        conn.commit()
+    invalidate_dashboard_stats()
+    return [s["id"] for s in students]
+
+def _allocate_student_ids(conn, count: int = 1) -> List[str]:
+    last = _next_sequence_value(conn, "student_id", count)
+    return [f"SID-{n:04d}" for n in range(last - count + 1, last + 1)]
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+@lru_cache(maxsize=4096)
+def _academic(previous_school: Optional[str], strand: str, semester: str, school_year: str) -> Academic:
+    return Academic(previous_school, strand, semester, school_year)
+
+def _summaries_from_rows(rows) -> List[StudentSummary]:
+    with tracer.span("reshape", "summaries_from_rows"):
+        return [StudentSummary(r["id"], r.get("student_id"), r.get("first_name"), r.get("last_name"),
+                               _intern(r.get("status") or "pending")) for r in rows]
+
+def _student_from_row(r: Dict[str, Any]) -> Student:
+    dob = r.get("date_of_birth")
+    return Student(
+        r.get("id"),
+        r.get("student_id"),
+        r.get("first_name"),
+        r.get("last_name"),
+        dob.isoformat() if isinstance(dob, date) else (dob or r.get("date_of_birth_raw") or ""),
+        _intern(r.get("gender")),
+        r.get("email"),
+        r.get("phone"),
+        _intern(r.get("status") or "pending"),
+        Guardian(r.get("guardian_name"), _intern(r.get("guardian_relation"))),
+        _academic(_intern(r.get("previous_school")), _intern(r.get("strand") or ""),
+                  _intern(r.get("semester") or ""), _intern(r.get("school_year") or "")),
+        _intern(r.get("submitted_by") or ""),
+        _intern(r.get("submitted_role") or "")
+    )
+
+DETAIL_CACHE_SIZE = 256
+
+class StudentDetailCache:
+    def __init__(self, maxsize: int = DETAIL_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._records: "OrderedDict[int, Student]" = OrderedDict()
+        # bumped on every invalidation so a fetch that raced a write does not cache the old row
+        self.generation = 0
+
+    def get(self, row_id: int) -> Optional[Student]:
+        with self._lock:
+            record = self._records.get(row_id)
+            if record is not None:
+                self._records.move_to_end(row_id)
+            return record
+
+    def put(self, record: Student, generation: int):
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._records[record.id] = record
+            self._records.move_to_end(record.id)
+            while len(self._records) > self.maxsize:
+                self._records.popitem(last=False)
+
+    def discard(self, row_ids):
+        with self._lock:
+            self.generation += 1
+            for row_id in row_ids:
+                self._records.pop(row_id, None)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._records.clear()
+
+_student_details = StudentDetailCache()
+
+def cached_student_detail(row_id: int) -> Optional[Student]:
+    return _student_details.get(row_id)
+
+def load_student_detail(row_id: int) -> Optional[Student]:
+    record = _student_details.get(row_id)
+    if record is not None:
+        return record
+    generation = _student_details.generation
+    with get_connection() as conn:
+        row = fetch_one(conn, "students.by_id", (row_id,))
+    if row is None:
+        return None
+    record = _student_from_row(row)
+    _student_details.put(record, generation)
+    return record
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _student_filter_sql(text: str = "", status: str = "All") -> Tuple[str, list]:
+    clauses, params = [], []
+    if status and status != "All":
+        clauses.append("status = %s")
+        params.append(status)
+    q = (text or "").strip().lower()
+    if q:
+        backend = get_backend()
+        fields = (backend.concat("COALESCE(first_name, '')", "' '", "COALESCE(last_name, '')"),
+                  "email", "phone", "student_id", "guardian_name")
+        clauses.append("(" + " OR ".join(backend.like(f) for f in fields) + ")")
+        params.extend([f"%{_escape_like(q)}%"] * len(fields))
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+class StudentSearchIndex:
+    GRAM = 3
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._text = {}
+        self._status = {}
+        self._postings = {}
+        self.version = -1
+
+    @staticmethod
+    def _entry(s) -> Tuple[int, str, str]:
+        if isinstance(s, Student):
+            fields = (s.full_name, s.email, s.phone, s.student_id, s.guardian.name)
+            return s.id, "\0".join(f or "" for f in fields).lower(), s.status
+        fields = (f"{s.get('first_name') or ''} {s.get('last_name') or ''}",
+                  s.get("email"), s.get("phone"), s.get("student_id"), s.get("guardian_name"))
+        return s["id"], "\0".join(f or "" for f in fields).lower(), s.get("status") or "pending"
+
+    def _advance(self, version: Optional[int]):
+        if version is not None and version == self.version + 1:
+            self.version = version
+
+    def add(self, s, version: Optional[int] = None):
+        row_id, text, status = self._entry(s)
+        n = self.GRAM
+        with self._lock:
+            self._status[row_id] = status
+            self._advance(version)
+            if self._text.get(row_id) == text:
+                return
+            self._text[row_id] = text
+            postings = self._postings
+            for gram in {text[i:i + n] for i in range(len(text) - n + 1)}:
+                posting = postings.get(gram)
+                if posting is None:
+                    postings[gram] = array("i", (row_id,))
+                else:
+                    posting.append(row_id)
+
+    def set_status(self, row_id: int, status: str, version: Optional[int] = None):
+        with self._lock:
+            if row_id in self._status:
+                self._status[row_id] = status
+            self._advance(version)
+
+    def mark_synced(self, version: int):
+        with self._lock:
+            self.version = max(self.version, version)
+
+    def __len__(self):
+        return len(self._text)
+
+    def search(self, text: str, status: str = "All") -> List[int]:
+        q = (text or "").strip().lower()
+        n = self.GRAM
+        with self._lock:
+            texts = self._text
+            if len(q) < n:
+                ids = sorted(row_id for row_id, t in texts.items() if q in t)
+            else:
+                postings = sorted((self._postings.get(q[i:i + n], ()) for i in range(len(q) - n + 1)), key=len)
+                candidates = set(postings[0])
+                for posting in postings[1:3]:
+                    if len(candidates) < 64:
+                        break
+                    candidates.intersection_update(posting)
+                ids = sorted(row_id for row_id in candidates if q in texts[row_id])
+            if status and status != "All":
+                st = self._status
+                ids = [row_id for row_id in ids if st[row_id] == status]
+            return ids
+
+    def build(self, rows, version: int = -1):
+        n = self.GRAM
+        lists = {}
+        texts, statuses = {}, {}
+        for s in rows:
+            row_id, text, status = self._entry(s)
+            texts[row_id] = text
+            statuses[row_id] = status
+            for gram in {text[i:i + n] for i in range(len(text) - n + 1)}:
+                lst = lists.get(gram)
+                if lst is None:
+                    lists[gram] = [row_id]
+                else:
+                    lst.append(row_id)
+        with self._lock:
+            self._text, self._status = texts, statuses
+            self._postings = {g: array("i", lst) for g, lst in lists.items()}
+            self.version = version
+
+_SEARCH_INDEX_COLUMNS = "id, first_name, last_name, email, phone, student_id, guardian_name, status"
+statement("search_index.all", f"SELECT {_SEARCH_INDEX_COLUMNS} FROM students ORDER BY id", rows="dict")
+statement("search_index.where", f"SELECT {_SEARCH_INDEX_COLUMNS} FROM students WHERE {{where}} ORDER BY id",
+          rows="dict")
+statement("search_index.changed_since",
+          f"SELECT {_SEARCH_INDEX_COLUMNS} FROM students WHERE row_version > %s ORDER BY id", rows="dict")
+_search_index: Optional[StudentSearchIndex] = None
+_search_index_lock = threading.Lock()
+
+def build_search_index() -> StudentSearchIndex:
+    global _search_index
+    with _search_index_lock:
+        if _search_index is None:
+            with get_connection() as conn:
+                version = students_version(conn)
+                rows = fetch_all(conn, "search_index.all")
+            index = StudentSearchIndex()
+            index.build(rows, version)
+            _search_index = index
+    return _search_index
+
+def _reindex_students(where: str, params: tuple):
+    index = _search_index
+    if index is None:
+        return
+    with get_connection() as conn:
+        rows = fetch_all(conn, "search_index.where", params, where=where)
+    for r in rows:
+        index.add(r)
+
+def _sync_search_index(index: StudentSearchIndex):
+    known = index.version
+    with get_connection() as conn:
+        version = students_version(conn)
+        if version == known:
+            return
+        rows = fetch_all(conn, "search_index.changed_since", (known,))
+    for r in rows:
+        index.add(r)
+    index.mark_synced(version)
+
+def _indexed_ids(text: str, status: str) -> Optional[List[int]]:
+    index = _search_index
+    if index is None or not (text or "").strip():
+        return None
+    return index.search(text, status)
+
+def load_students_by_ids(ids: List[int]) -> List[StudentSummary]:
+    if not ids:
+        return []
+    by_id = {}
+    with get_connection() as conn:
+        # chunked so a long scrolled-through search stays under the driver's bind-variable limit
+        for i in range(0, len(ids), BULK_UPDATE_CHUNK):
+            chunk = tuple(ids[i:i + BULK_UPDATE_CHUNK])
+            by_id.update((r["id"], r) for r in fetch_all(conn, "students.by_ids", chunk, ids=_placeholders(len(chunk))))
+    return _summaries_from_rows(by_id[i] for i in ids if i in by_id)
+
+def count_students(text: str = "", status: str = "All") -> int:
+    ids = _indexed_ids(text, status)
+    if ids is not None:
+        return len(ids)
+    return _count_students_sql(*_student_filter_sql(text, status))
+
+def _count_students_sql(where: str, params: list) -> int:
+    with get_connection() as conn:
+        return int(fetch_value(conn, "students.count", params, where=where))
+
+def query_students(text: str = "", status: str = "All", after_id: Optional[int] = None,
+                   limit: int = 200) -> List[StudentSummary]:
+    ids = _indexed_ids(text, status)
+    if ids is not None:
+        start = bisect_right(ids, after_id) if after_id is not None else 0
+        return load_students_by_ids(ids[start:start + limit])
+    where, params = _student_filter_sql(text, status)
+    if after_id is not None:
+        where += (" AND " if where else " WHERE ") + "id > %s"
+        params.append(after_id)
+    with get_connection() as conn:
+        return _summaries_from_rows(fetch_all(conn, "students.page", (*params, limit), where=where))
+
+def search_students(text: str = "", status: str = "All", limit: int = 200) -> Tuple[int, List[StudentSummary]]:
+    index = _search_index
+    if index is not None and (text or "").strip():
+        _sync_search_index(index)
+        ids = index.search(text, status)
+        return len(ids), load_students_by_ids(ids[:limit])
+    total = count_students(text, status)
+    return total, (query_students(text, status, limit=limit) if total else [])
+
+def changes_since(since: Optional[int], limit: int = 1000) -> Tuple[int, Optional[List[Tuple[int, int, str]]]]:
+    with get_connection() as conn:
+        version = students_version(conn)
+        if since is None or version == since:
+            return version, []
+        rows = [(int(v), int(pk), op) for v, pk, op in fetch_all(conn, "student_changes.since", (since, limit + 1))]
+    if not rows or len(rows) > limit or rows[0][0] != since + 1:
+        _student_details.clear()
+        return version, None
+    _student_details.discard({pk for _, pk, _ in rows})
+    return version, rows
+
+def changed_students(ids: List[int], text: str = "", status: str = "All") -> Tuple[int, List[StudentSummary]]:
+    index = _search_index
+    if index is not None and (text or "").strip():
+        _sync_search_index(index)
+        matching = index.search(text, status)
+        wanted = set(ids)
+        return len(matching), load_students_by_ids([i for i in matching if i in wanted])
+    where, params = _student_filter_sql(text, status)
+    where += (" AND " if where else " WHERE ") + "id IN ({ids})"
+    ids = sorted(set(ids))
+    found = []
+    with get_connection() as conn:
+        # chunked like load_students_by_ids; the change feed can hand over up to 1000 ids
+        for i in range(0, len(ids), BULK_UPDATE_CHUNK):
+            chunk = ids[i:i + BULK_UPDATE_CHUNK]
+            found.extend(fetch_all(conn, "students.filtered", (*params, *chunk),
+                                   where=where.format(ids=_placeholders(len(chunk)))))
+    return count_students(text, status), _summaries_from_rows(found)
+
+EXPORT_COLUMNS = (
+    ("Student ID", "student_id"), ("First Name", "first_name"), ("Last Name", "last_name"),
+    ("Date of Birth", "date_of_birth"), ("Gender", "gender"), ("Email", "email"), ("Phone", "phone"),
+    ("Status", "status"), ("Guardian Name", "guardian_name"), ("Guardian Relation", "guardian_relation"),
+    ("Previous School", "previous_school"), ("Strand", "strand"), ("Semester", "semester"),
+    ("School Year", "school_year"), ("Submitted By", "submitted_by")
+)
+EXPORT_BATCH_SIZE = 1000
+statement("students.export", "SELECT " + ", ".join(
+    "COALESCE(date_of_birth, date_of_birth_raw)" if c == "date_of_birth" else c for _, c in EXPORT_COLUMNS
+) + " FROM students{where} ORDER BY id", rows="stream")
+
+def _export_writer(path: str):
+    if os.path.splitext(path)[1].lower() == ".xlsx":
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise RuntimeError("Writing .xlsx files requires openpyxl (pip install openpyxl).")
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Students")
+        return ws.append, lambda: wb.save(path)
+    f = open(path, "w", newline="", encoding="utf-8-sig")
+    return csv.writer(f).writerow, f.close
+
+def export_students(path: str, text: str = "", status: str = "All", progress: Optional[Callable] = None) -> int:
+    where, params = _student_filter_sql(text, status)
+    # count with the same WHERE the rows are streamed with, not the search index
+    total = _count_students_sql(where, params)
+    tmp_path = path + ".part"
+    write, finish = _export_writer(tmp_path)
+    written = 0
+    try:
+        write([h for h, _ in EXPORT_COLUMNS])
+        with get_connection() as conn:
+            cur = query(conn, "students.export", params, where=where)
+            try:
+                while True:
+                    batch = cur.fetchmany(EXPORT_BATCH_SIZE)
+                    if not batch:
+                        break
+                    for row in batch:
+                        write(["" if v is None else v.isoformat() if isinstance(v, date) else v for v in row])
+                    written += len(batch)
+                    if progress is not None:
+                        progress((written, total))
+            finally:
+                cur.close()
+        finish()
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            try:
+                finish()
+            except Exception:
+                pass
+            os.remove(tmp_path)
+        raise
+    return written
+
 def save_students_to_file(data: List[Dict[str, Any]]):
     save_students_to_db(data)
 
+_dashboard_stats: Optional[Tuple[int, Dict[str, Any]]] = None
+statement("dashboard.status_counts", "SELECT status, COUNT(*) FROM students GROUP BY status")
+statement("dashboard.strand_counts", "SELECT COALESCE(NULLIF(strand, ''), 'Unspecified') AS st, COUNT(*) "
+                                     "FROM students GROUP BY st ORDER BY MIN(id)")
+
+def load_dashboard_stats() -> Dict[str, Any]:
+    global _dashboard_stats
+    cached = _dashboard_stats
+    with get_connection() as conn:
+        version = students_version(conn)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        status_counts = {st: int(n) for st, n in fetch_all(conn, "dashboard.status_counts")}
+        strands = [(st, int(n)) for st, n in fetch_all(conn, "dashboard.strand_counts")]
+    strands.sort(key=lambda x: x[1], reverse=True)
+    stats = {"total": sum(status_counts.values()), "status": status_counts, "strands": strands}
+    _dashboard_stats = (version, stats)
+    return stats
+
+def invalidate_dashboard_stats():
+    global _dashboard_stats
+    _dashboard_stats = None
+
+def validate_student(s: Dict[str, Any]) -> Optional[str]:
+    g = s.get("guardian") or {}
+    a = s.get("academic") or {}
+    if not all(s.get(k) for k in ("first_name", "last_name", "date_of_birth", "email", "phone")):
+        return "Please fill in required fields (name, date of birth, email, phone)."
+    if parse_date_of_birth(s["date_of_birth"]) is None:
+        return "Please enter date of birth as YYYY-MM-DD or MM/DD/YYYY."
+    if s.get("gender") not in GENDERS:
+        return "Please select gender."
+    if a.get("strand") not in STRANDS:
+        return "Please select strand."
+    if a.get("semester") not in SEMESTERS:
+        return "Please select semester."
+    if a.get("school_year") not in SCHOOL_YEARS:
+        return "Please select school year."
+    if g.get("relation") not in (None, "") and g.get("relation") not in GUARDIAN_RELATIONS:
+        return "Please select a valid guardian relation."
+    return None
+
+IMPORT_CHUNK_SIZE = 1000
+
+class ImportReport:
+    def __init__(self):
+        self.processed = 0
+        self.inserted = 0
+        self.errors: List[Tuple[int, str]] = []
+        self.elapsed = 0.0
+
+def _import_key(header) -> str:
+    return str(header or "").strip().lower().replace(" ", "_")
+
+def _cell_text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+def _canonical(value: str, allowed: Tuple[str, ...]) -> str:
+    for option in allowed:
+        if option.lower() == value.lower():
+            return option
+    return value
+
+def iter_import_rows(path: str) -> Iterator[Tuple[int, Dict[str, str]]]:
+    if os.path.splitext(path)[1].lower() == ".xlsx":
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise RuntimeError("Reading .xlsx files requires openpyxl (pip install openpyxl).")
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            keys = [_import_key(h) for h in next(rows, ())]
+            for line_no, values in enumerate(rows, 2):
+                if not values or all(v in (None, "") for v in values):
+                    continue
+                yield line_no, {k: _cell_text(v) for k, v in zip(keys, values) if k}
+        finally:
+            wb.close()
+        return
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        keys = [_import_key(h) for h in next(reader, ())]
+        for values in reader:
+            if not any(v.strip() for v in values):
+                continue
+            yield reader.line_num, {k: v.strip() for k, v in zip(keys, values) if k}
+
+def _student_from_import_row(row: Dict[str, str]) -> Dict[str, Any]:
+    def v(key):
+        return row.get(key) or ""
+    return {
+        "first_name": v("first_name"),
+        "last_name": v("last_name"),
+        "date_of_birth": v("date_of_birth"),
+        "gender": _canonical(v("gender"), GENDERS),
+        "email": v("email"),
+        "phone": v("phone"),
+        "guardian": {
+            "name": v("guardian_name") or None,
+            "phone": v("guardian_phone") or None,
+            "relation": _canonical(v("guardian_relation"), GUARDIAN_RELATIONS) or None
+        },
+        "academic": {
+            "previous_school": v("previous_school") or None,
+            "strand": _canonical(v("strand"), STRANDS),
+            "semester": _canonical(v("semester"), SEMESTERS),
+            "school_year": v("school_year")
+        },
+        "status": "pending"
+    }
+
+def import_chunk_limit() -> int:
+    return get_backend().max_bind_params
+
+def import_students(path: str, submitted_by: str, submitted_role: str = "staff",
+                    chunk_size: int = IMPORT_CHUNK_SIZE, progress: Optional[Callable] = None) -> ImportReport:
+    report = ImportReport()
+    started = time.perf_counter()
+    chunk: List[Tuple[int, Dict[str, Any]]] = []
+    # insert_students looks the chunk's ids up with one bound parameter per row
+    chunk_size = max(1, min(chunk_size, import_chunk_limit()))
+
+    def flush():
+        if not chunk:
+            return
+        try:
+            insert_students([s for _, s in chunk])
+            report.inserted += len(chunk)
+        except _DATA_ERRORS:
+            for line_no, s in chunk:
+                s.pop("student_id", None)
+                try:
+                    insert_students([s])
+                    report.inserted += 1
+                except _DATA_ERRORS as e:
+                    report.errors.append((line_no, str(e)))
+        chunk.clear()
+        if progress is not None:
+            progress(report)
+
+    for line_no, row in iter_import_rows(path):
+        report.processed += 1
+        student = _student_from_import_row(row)
+        error = validate_student(student)
+        if error:
+            report.errors.append((line_no, error))
+            continue
+        student["submitted_by"] = submitted_by
+        student["submitted_role"] = submitted_role
+        chunk.append((line_no, student))
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+    report.elapsed = time.perf_counter() - started
+    return report
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+    progress = pyqtSignal(object)
+
+class BackgroundTask(QRunnable):
+    def __init__(self, fn: Callable, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelled = False
+        self.action: Optional[Action] = None
+        self.signals = _TaskSignals()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        emitted = False
+        try:
+            if self.cancelled:
+                return
+            with tracer.activate(self.action):
+                try:
+                    result = self.fn(*self.args, **self.kwargs)
+                except Exception as e:
+                    if not self.cancelled:
+                        self.signals.failed.emit(e)
+                        emitted = True
+                    return
+            if not self.cancelled:
+                self.signals.finished.emit(result)
+                emitted = True
+        finally:
+            # emitted results release the action on the GUI thread, after their callbacks
+            if not emitted and self.action is not None:
+                self.action.release()
+
+def run_in_background(fn: Callable, *args, on_result: Optional[Callable] = None, on_error: Optional[Callable] = None,
+                      on_progress: Optional[Callable] = None, pool: Optional[QThreadPool] = None,
+                      **kwargs) -> BackgroundTask:
+    task = BackgroundTask(fn, *args, **kwargs)
+    action = tracer.current()
+    if on_progress is not None:
+        task.signals.progress.connect(tracer.bind(action, on_progress))
+        task.kwargs["progress"] = task.signals.progress.emit
+    if on_result is not None:
+        task.signals.finished.connect(tracer.bind(action, on_result))
+    if on_error is not None:
+        task.signals.failed.connect(tracer.bind(action, on_error))
+    if action is not None:
+        action.hold()
+        task.action = action
+        task.signals.finished.connect(lambda _: action.release())
+        task.signals.failed.connect(lambda _: action.release())
+    (pool or QThreadPool.globalInstance()).start(task)
+    return task
+
+statement("users.by_username", "SELECT id, username, password, role FROM users WHERE username=%s", rows="dict")
+statement("users.upgrade_password", "UPDATE users SET password=%s WHERE id=%s AND password=%s")
+
+def prepare_database():
+    global _dummy_password_hash
+    ensure_schema()
+    if _dummy_password_hash is None:
+        _dummy_password_hash = hash_password(secrets.token_hex(8))
+
+def authenticate(username: str, password: str) -> Optional[Dict[str, str]]:
+    with get_connection() as conn:
+        user = fetch_one(conn, "users.by_username", (username,))
+    if not user:
+        # spend the same KDF time as a real check so unknown usernames are not distinguishable
+        if _dummy_password_hash is not None:
+            verify_password(password, _dummy_password_hash)
+        else:
+            hash_password(password)
+        return None
+    stored = user["password"] or ""
+    with tracer.span("auth", "verify_password"):
+        if is_password_hash(stored):
+            ok = verify_password(password, stored)
+        else:
+            ok = bool(stored) and hmac.compare_digest(stored.encode("utf-8"), password.encode("utf-8"))
+    if not ok:
+        return None
+    if password_needs_rehash(stored):
+        with get_connection() as conn:
+            query(conn, "users.upgrade_password", (hash_password(password), user["id"], stored))
+            conn.commit()
+    return {"username": user["username"], "role": user["role"]}
+
 class LoginDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Login")
         self.setMinimumSize(380, 320)
         self.user = None
+        self._login_task = None
+        self._db_pool = QThreadPool(self)
+        self._db_pool.setMaxThreadCount(1)
         self.setStyleSheet("background-color: #eef7ff;")
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
@@ -180,56 +1837,73 @@ class LoginDialog(QDialog):
         self.password_edit.setStyleSheet("padding:4px; border:1px solid #d0d7de; border-radius:6px;")
         container_layout.addWidget(self.password_edit)
 
-        login_btn = QPushButton("Login")
-        login_btn.setMinimumHeight(32)
-        login_btn.setStyleSheet(
+        self.login_btn = QPushButton("Login")
+        self.login_btn.setMinimumHeight(32)
+        self.login_btn.setStyleSheet(
             "QPushButton { background-color: #2563eb; color: white; padding: 6px; border-radius: 8px; }"
             "QPushButton:hover { background-color: #1d4ed8; }"
         )
-        login_btn.clicked.connect(self.attempt_login)
-        container_layout.addWidget(login_btn)
+        self.login_btn.clicked.connect(self.attempt_login)
+        container_layout.addWidget(self.login_btn)
+
+        self.db_status_lbl = QLabel("Connecting to database...")
+        self.db_status_lbl.setStyleSheet("color:#556675; font-size:11px;")
+        self.db_status_lbl.setWordWrap(True)
+        container_layout.addWidget(self.db_status_lbl)
 
         layout.addWidget(container)
 
-        self._ensure_users_in_db()
+        # same single-thread pool as attempt_login, so the schema (and the default users) exist before the first lookup
+        run_in_background(prepare_database, pool=self._db_pool,
+                          on_result=self._database_ready, on_error=self._database_failed)
 
         self.username_edit.returnPressed.connect(lambda: self.password_edit.setFocus())
-        self.password_edit.returnPressed.connect(login_btn.click)
-
-    def _ensure_users_in_db(self):
-        conn = get_connection()
-        cur = conn.cursor(pymysql.cursors.DictCursor)
-        cur.execute("SELECT COUNT(*) AS cnt FROM users")
-        row = cur.fetchone()
-        count = row.get("cnt", 0) if row else 0
-        if count == 0:
-            cur.execute("INSERT INTO users (username,password,role) VALUES (%s,%s,%s)", ("admin", "admin123", "admin"))
-            cur.execute("INSERT INTO users (username,password,role) VALUES (%s,%s,%s)", ("staff", "staff123", "staff"))
-            conn.commit()
-        conn.close()
+        self.password_edit.returnPressed.connect(self.login_btn.click)
+
+    def _database_ready(self, _result):
+        self.db_status_lbl.setVisible(False)
+
+    def _database_failed(self, error: Exception):
+        self.db_status_lbl.setText(f"Database unavailable: {error}")
+        self.db_status_lbl.setStyleSheet("color:#b91c1c; font-size:11px;")
+
+    def _set_busy(self, busy: bool):
+        self.login_btn.setEnabled(not busy)
+        self.login_btn.setText("Signing in..." if busy else "Login")
 
     def attempt_login(self):
-        username = self.username_edit.text().strip()
-        password = self.password_edit.text().strip()
-        if not username or not password:
-            QMessageBox.warning(self, "Login failed", "Please enter username and password.")
-            return
-        conn = get_connection()
-        cur = conn.cursor(pymysql.cursors.DictCursor)
-        cur.execute("SELECT * FROM users WHERE username=%s AND password=%s", (username, password))
-        user = cur.fetchone()
-        conn.close()
+        with tracer.action("login"):
+            if self._login_task is not None:
+                return
+            username = self.username_edit.text().strip()
+            password = self.password_edit.text().strip()
+            if not username or not password:
+                QMessageBox.warning(self, "Login failed", "Please enter username and password.")
+                return
+            self._set_busy(True)
+            self._login_task = run_in_background(
+                authenticate, username, password, pool=self._db_pool,
+                on_result=self._login_done, on_error=self._login_failed
+            )
+
+    def _login_done(self, user: Optional[Dict[str, str]]):
+        self._login_task = None
+        self._set_busy(False)
         if user:
-            self.user = {"username": user["username"], "role": user["role"]}
+            self.user = user
             self.accept()
         else:
             QMessageBox.warning(self, "Login failed", "Invalid username or password.")
 
+    def _login_failed(self, error: Exception):
+        self._login_task = None
+        self._set_busy(False)
+        QMessageBox.warning(self, "Login failed", f"Could not reach the database: {error}")
+
 class RecordDialog(QDialog):
-    def __init__(self, student: dict, original_index: int = -1, role: str = "staff", parent=None):
+    def __init__(self, student: Optional[Student], role: str = "staff", parent=None):
         super().__init__(parent)
-        self.student = student or {}
-        self.original_index = original_index
+        self.student = student or Student()
         self.role = role
         self.setWindowTitle("Student Record")
         self.setMinimumSize(560, 380)
@@ -250,25 +1924,24 @@ class RecordDialog(QDialog):
         header_layout.setContentsMargins(10, 8, 10, 8)
         header_layout.setSpacing(8)
 
-        initials = (self.student.get("first_name", " ")[0:1] + self.student.get("last_name", " ")[0:1]).upper()
-        avatar = QLabel(initials)
+        avatar = QLabel(self.student.initials)
         avatar.setFixedSize(56, 56)
         avatar.setAlignment(Qt.AlignmentFlag.AlignCenter)
         avatar.setStyleSheet("background-color: #e0efff; color: #0b3b7a; border-radius: 28px; font-weight:700; font-size:16px;")
         header_layout.addWidget(avatar)
 
         name_block = QVBoxLayout()
-        name_lbl = QLabel(f"{self.student.get('first_name','')} {self.student.get('last_name','')}")
+        name_lbl = QLabel(self.student.full_name)
         name_lbl.setStyleSheet("font-size:14px; font-weight:800; color: #07204a;")
         name_block.addWidget(name_lbl)
-        sid = self.student.get("student_id", "") or self.student.get("id", "")
+        sid = self.student.student_id or self.student.id or ""
         id_lbl = QLabel(f"Student ID: {sid}")
         id_lbl.setStyleSheet("color:#0b355e; font-size:11px;")
         name_block.addWidget(id_lbl)
         header_layout.addLayout(name_block)
         header_layout.addStretch()
 
-        status = self.student.get("status", "pending")
+        status = self.student.status or "pending"
         badge = QLabel(status.capitalize())
         badge.setStyleSheet("QLabel { padding:4px 6px; border-radius:8px; font-weight:700; font-size:11px; }")
         if status == "approved":
@@ -291,21 +1964,20 @@ class RecordDialog(QDialog):
         info_grid.setVerticalSpacing(6)
 
         info_grid.addWidget(QLabel("Date of birth:"), 0, 0, Qt.AlignmentFlag.AlignLeft)
-        info_grid.addWidget(QLabel(self.student.get("date_of_birth", "")), 0, 1, Qt.AlignmentFlag.AlignLeft)
+        info_grid.addWidget(QLabel(self.student.date_of_birth or ""), 0, 1, Qt.AlignmentFlag.AlignLeft)
         info_grid.addWidget(QLabel("Gender:"), 1, 0, Qt.AlignmentFlag.AlignLeft)
-        info_grid.addWidget(QLabel(self.student.get("gender", "")), 1, 1, Qt.AlignmentFlag.AlignLeft)
+        info_grid.addWidget(QLabel(self.student.gender or ""), 1, 1, Qt.AlignmentFlag.AlignLeft)
         info_grid.addWidget(QLabel("Email:"), 2, 0, Qt.AlignmentFlag.AlignLeft)
-        info_grid.addWidget(QLabel(self.student.get("email", "")), 2, 1, Qt.AlignmentFlag.AlignLeft)
+        info_grid.addWidget(QLabel(self.student.email or ""), 2, 1, Qt.AlignmentFlag.AlignLeft)
 
         info_grid.addWidget(QLabel("Phone:"), 0, 2, Qt.AlignmentFlag.AlignLeft)
-        info_grid.addWidget(QLabel(self.student.get("phone", "")), 0, 3, Qt.AlignmentFlag.AlignLeft)
-        g = self.student.get("guardian", {}) or {}
-        gname = g.get("name") if g.get("name") not in (None, "") else "N/A"
-        grel = g.get("relation") if g.get("relation") not in (None, "") else "N/A"
+        info_grid.addWidget(QLabel(self.student.phone or ""), 0, 3, Qt.AlignmentFlag.AlignLeft)
+        g = self.student.guardian
+        gname = g.name or "N/A"
+        grel = g.relation or "N/A"
         info_grid.addWidget(QLabel("Guardian:"), 1, 2, Qt.AlignmentFlag.AlignLeft)
         info_grid.addWidget(QLabel(f"{gname} ({grel})"), 1, 3, Qt.AlignmentFlag.AlignLeft)
-        a = self.student.get("academic", {}) or {}
-        prev_school = a.get("previous_school") if a.get("previous_school") not in (None, "") else "N/A"
+        prev_school = self.student.academic.previous_school or "N/A"
         info_grid.addWidget(QLabel("Previous School:"), 2, 2, Qt.AlignmentFlag.AlignLeft)
         info_grid.addWidget(QLabel(prev_school), 2, 3, Qt.AlignmentFlag.AlignLeft)
 
@@ -317,21 +1989,21 @@ class RecordDialog(QDialog):
             self.admin_status = QComboBox()
             self.admin_status.addItems(["pending", "approved", "declined"])
             try:
-                self.admin_status.setCurrentText(self.student.get("status", "pending"))
+                self.admin_status.setCurrentText(self.student.status or "pending")
             except Exception:
                 pass
             self.admin_status.setFixedWidth(130)
             self.admin_status.setStyleSheet("padding:4px; font-size:11px; border-radius:6px;")
-            save_btn = QPushButton("Save")
-            save_btn.setStyleSheet("QPushButton { background-color:#0ea5a4; color: white; padding:6px 10px; border-radius:8px; }")
-            save_btn.clicked.connect(self._save_and_close)
+            self.save_btn = QPushButton("Save")
+            self.save_btn.setStyleSheet("QPushButton { background-color:#0ea5a4; color: white; padding:6px 10px; border-radius:8px; }")
+            self.save_btn.clicked.connect(self._save_and_close)
             btn_row.addWidget(self.admin_status)
-            btn_row.addWidget(save_btn)
+            btn_row.addWidget(self.save_btn)
 
-        close_btn = QPushButton("Close")
-        close_btn.setStyleSheet("QPushButton { background-color:#e5e7eb; padding:6px 10px; border-radius:8px; }")
-        close_btn.clicked.connect(self.reject)
-        btn_row.addWidget(close_btn)
+        self.close_btn = QPushButton("Close")
+        self.close_btn.setStyleSheet("QPushButton { background-color:#e5e7eb; padding:6px 10px; border-radius:8px; }")
+        self.close_btn.clicked.connect(self.reject)
+        btn_row.addWidget(self.close_btn)
 
         card_layout.addLayout(btn_row)
         main.addWidget(card)
@@ -343,27 +2015,258 @@ class RecordDialog(QDialog):
         card.setGraphicsEffect(shadow)
 
     def _save_and_close(self):
-        if not hasattr(self, "admin_status"):
-            self.accept()
-            return
-        new_status = self.admin_status.currentText()
-        data = load_students_from_file()
-        if 0 <= self.original_index < len(data):
-            data[self.original_index]["status"] = new_status
-            save_students_to_file(data)
+        with tracer.action("save_status"):
+            if not hasattr(self, "admin_status"):
+                self.accept()
+                return
+            new_status = self.admin_status.currentText()
+            row_id = self.student.id
+            if row_id is None:
+                self._saved(new_status, False)
+                return
+            self._set_saving(True)
+            run_in_background(update_student_status, row_id, new_status,
+                              on_result=partial(self._saved, new_status), on_error=self._save_failed)
+
+    def _set_saving(self, saving: bool):
+        self.save_btn.setEnabled(not saving)
+        self.close_btn.setEnabled(not saving)
+        self.save_btn.setText("Saving..." if saving else "Save")
+
+    def _saved(self, new_status: str, found: bool):
+        self._set_saving(False)
+        if found:
+            self.student.status = new_status
             QMessageBox.information(self, "Saved", "Student status updated.")
             self.accept()
         else:
             QMessageBox.warning(self, "Error", "Could not locate student to save.")
             self.reject()
 
+    def _save_failed(self, error: Exception):
+        self._set_saving(False)
+        QMessageBox.warning(self, "Error", f"Could not save status: {error}")
+
+    def reject(self):
+        if self.close_btn.isEnabled():
+            super().reject()
+
+class StudentsTableModel(QAbstractTableModel):
+    COLUMNS = ["Name", "Student ID", "Status"]
+    loadingChanged = pyqtSignal(bool)
+
+    def __init__(self, fetch_page: Callable[[Optional[int], int], List[StudentSummary]],
+                 batch_size: int = 200, pool: Optional[QThreadPool] = None, parent=None):
+        super().__init__(parent)
+        self._fetch_page = fetch_page
+        self._pool = pool
+        self._fetching = None
+        self._generation = 0
+        self.batch_size = batch_size
+        self._total = 0
+        self._ids = []
+        self._names = []
+        self._student_ids = []
+        self._statuses = []
+        self._records = {}
+        self._row_of = {}
+
+    @staticmethod
+    def _columns_for(rows: List[StudentSummary]):
+        ids, names, sids, statuses = [], [], [], []
+        for s in rows:
+            ids.append(s.id)
+            names.append(s.full_name)
+            sids.append(s.display_id)
+            statuses.append(s.status)
+        return ids, names, sids, statuses
+
+    def reload(self, total: int, rows: List[StudentSummary]):
+        self.set_rows(rows, total)
+
+    def set_rows(self, rows: List[StudentSummary], total: int):
+        self._generation += 1
+        ids, names, sids, statuses = self._columns_for(rows)
+        old_loaded = len(self._ids)
+        keep = 0
+        limit = min(old_loaded, len(ids))
+        while keep < limit and self._ids[keep] == ids[keep]:
+            keep += 1
+
+        changed = [r for r in range(keep)
+                   if (self._names[r], self._student_ids[r], self._statuses[r]) != (names[r], sids[r], statuses[r])]
+
+        if keep < old_loaded:
+            self.beginRemoveRows(QModelIndex(), keep, old_loaded - 1)
+            for col in (self._ids, self._names, self._student_ids, self._statuses):
+                del col[keep:]
+            self.endRemoveRows()
+
+        self._total = max(total, len(ids))
+        if len(ids) > keep:
+            self.beginInsertRows(QModelIndex(), keep, len(ids) - 1)
+            self._ids, self._names, self._student_ids, self._statuses = ids, names, sids, statuses
+            self.endInsertRows()
+        else:
+            self._ids, self._names, self._student_ids, self._statuses = ids, names, sids, statuses
+        self._records = {s.id: s for s in rows}
+        self._row_of = {pk: r for r, pk in enumerate(ids)}
+
+        last_col = len(self.COLUMNS) - 1
+        start = None
+        for i, r in enumerate(changed):
+            if start is None:
+                start = r
+            if i + 1 == len(changed) or changed[i + 1] != r + 1:
+                self.dataChanged.emit(self.index(start, 0), self.index(r, last_col))
+                start = None
+
+    def apply_delta(self, ids: List[int], rows: List[StudentSummary], total: int):
+        fresh = {s.id: s for s in rows}
+        more = self.canFetchMore()
+        columns = (self._ids, self._names, self._student_ids, self._statuses)
+        last_col = len(self.COLUMNS) - 1
+        for pk in ids:
+            row = self._row_of.get(pk, -1)
+            rec = fresh.get(pk)
+            if row >= 0 and rec is not None:
+                for col, values in zip(columns, self._columns_for([rec])):
+                    col[row] = values[0]
+                self._records[pk] = rec
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_col))
+            elif row >= 0:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                for col in columns:
+                    del col[row]
+                self._records.pop(pk, None)
+                self._row_of = {p: r for r, p in enumerate(self._ids)}
+                self.endRemoveRows()
+            elif rec is not None:
+                pos = bisect_left(self._ids, pk)
+                if pos == len(self._ids) and more:
+                    continue
+                self.beginInsertRows(QModelIndex(), pos, pos)
+                for col, values in zip(columns, self._columns_for([rec])):
+                    col.insert(pos, values[0])
+                self._records[pk] = rec
+                self._row_of = {p: r for r, p in enumerate(self._ids)}
+                self.endInsertRows()
+        self._total = max(total, len(self._ids))
+
+    def row_id(self, row: int):
+        if 0 <= row < len(self._ids):
+            return self._ids[row]
+        return None
+
+    def row_for_id(self, row_id) -> int:
+        return self._row_of.get(row_id, -1)
+
+    def record(self, row_id) -> Optional[StudentSummary]:
+        return self._records.get(row_id)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._ids) < self._total
+
+    def is_loading(self) -> bool:
+        return self._fetching is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self._fetching is not None or not self.canFetchMore(parent):
+            return
+        with tracer.action("fetch_page"):
+            self._fetching = run_in_background(
+                self._fetch_page, self._ids[-1] if self._ids else None, self.batch_size, pool=self._pool,
+                on_result=partial(self._append_page, self._generation),
+                on_error=partial(self._page_failed, self._generation)
+            )
+        self.loadingChanged.emit(True)
+
+    def _page_failed(self, generation: int, error: Exception):
+        self._fetching = None
+        self.loadingChanged.emit(False)
+
+    def _append_page(self, generation: int, rows: List[StudentSummary]):
+        with tracer.span("ui", "table.append_page"):
+            self._fetching = None
+            self.loadingChanged.emit(False)
+            if generation != self._generation:
+                return
+            if not rows:
+                self._total = len(self._ids)
+                return
+            if self._ids:
+                # apply_delta may already have appended some of these while the page was in flight
+                rows = [s for s in rows if s.id > self._ids[-1]]
+                if not rows:
+                    return
+            ids, names, sids, statuses = self._columns_for(rows)
+            start = len(self._ids)
+            self.beginInsertRows(QModelIndex(), start, start + len(ids) - 1)
+            self._ids.extend(ids)
+            self._names.extend(names)
+            self._student_ids.extend(sids)
+            self._statuses.extend(statuses)
+            for r, s in enumerate(rows, start):
+                self._records[s.id] = s
+                self._row_of[s.id] = r
+            self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._ids):
+            return None
+        r, c = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if c == 0:
+                return self._names[r]
+            if c == 1:
+                return self._student_ids[r]
+            if c == 2:
+                return self._statuses[r]
+        elif role == Qt.ItemDataRole.ToolTipRole and c == 0:
+            return self._names[r]
+        elif role == Qt.ItemDataRole.UserRole:
+            return self._ids[r]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
 class StudentsTable(QWidget):
+    SEARCH_DEBOUNCE_MS = 250
+
     def __init__(self, role="staff", parent=None):
         super().__init__(parent)
         self.role = role
         self.filter_text = ""
         self.filter_status = "All"
-        self.current_entries = []
+        self._shown_filter = ("", "All")
+        self._search_generation = 0
+        self._pending_search = None
+
+        self._search_pool = QThreadPool(self)
+        self._search_pool.setMaxThreadCount(1)
+        self._detail_pool = QThreadPool(self)
+        self._detail_pool.setMaxThreadCount(1)
+        self._pending_detail = None
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.refresh_table)
+        if _search_index is None:
+            run_in_background(build_search_index)
 
         outer = QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
@@ -395,16 +2298,41 @@ class StudentsTable(QWidget):
         self.status_filter_combo.currentTextChanged.connect(self._on_status_filter_changed)
         self.status_filter_combo.setStyleSheet("padding:4px; border:1px solid #d0d7de; border-radius:6px;")
         filter_row.addWidget(self.status_filter_combo)
+        self.loading_lbl = QLabel("Loading...")
+        self.loading_lbl.setStyleSheet("color:#556675; font-size:11px;")
+        self.loading_lbl.setVisible(False)
+        filter_row.addWidget(self.loading_lbl)
         filter_row.addStretch()
+        self.export_progress = QProgressBar()
+        self.export_progress.setFixedWidth(140)
+        self.export_progress.setVisible(False)
+        filter_row.addWidget(self.export_progress)
+        self.export_btn = QPushButton("Export...")
+        self.export_btn.setStyleSheet("QPushButton { background-color:#e5e7eb; padding:4px 10px; border-radius:6px; }")
+        self.export_btn.clicked.connect(self._export_filtered)
+        filter_row.addWidget(self.export_btn)
         left_col.addLayout(filter_row)
 
-        self.table = QTableWidget()
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.model = StudentsTableModel(self._fetch_page, pool=self._search_pool, parent=self)
+        self.model.loadingChanged.connect(lambda _: self._update_loading())
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.table.setWordWrap(False)
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setStyleSheet("QTableWidget { border: none; }")
+        self.table.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.table.selectionModel().selectionChanged.connect(lambda *_: self._on_selection_changed())
+        vheader = self.table.verticalHeader()
+        vheader.setVisible(False)
+        vheader.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vheader.setDefaultSectionSize(self.table.fontMetrics().height() + 10)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionsMovable(False)
+        header.setStretchLastSection(False)
+        self.table.setStyleSheet("QTableView { border: none; }")
         left_col.addWidget(self.table, 1)
 
         container_layout.addLayout(left_col, 1)
@@ -507,124 +2435,167 @@ class StudentsTable(QWidget):
 
     def _on_search_changed(self, text):
         self.filter_text = text.strip()
-        self.refresh_table()
-
-    def _matches_filter(self, s: dict):
-        if self.filter_status != "All" and s.get("status", "pending") != self.filter_status:
-            return False
-        if not self.filter_text:
-            return True
-        q = self.filter_text.lower()
-        fullname = (s.get("first_name", "") + " " + s.get("last_name", "")).lower()
-        if q in fullname or q in s.get("email", "").lower() or q in s.get("phone", "").lower():
-            return True
-        if q in (s.get("student_id") or "").lower():
-            return True
-        g = s.get("guardian", {}) or {}
-        if q in (g.get("name") or "").lower():
-            return True
-        return False
+        self._search_timer.start()
+
+    def _export_filtered(self):
+        with tracer.action("export"):
+            path, selected = QFileDialog.getSaveFileName(self, "Export students", "students.csv",
+                                                         "CSV (*.csv);;Excel workbook (*.xlsx)")
+            if not path:
+                return
+            if not os.path.splitext(path)[1]:
+                path += ".xlsx" if "xlsx" in selected else ".csv"
+            self.export_btn.setEnabled(False)
+            self.export_progress.setRange(0, 0)
+            self.export_progress.setVisible(True)
+            run_in_background(
+                export_students, path, *self._shown_filter,
+                on_progress=self._export_progress,
+                on_result=partial(self._export_done, path), on_error=self._export_failed
+            )
+
+    def _export_progress(self, state: Tuple[int, int]):
+        written, total = state
+        self.export_progress.setRange(0, max(total, written, 1))
+        self.export_progress.setValue(written)
+
+    def _export_done(self, path: str, written: int):
+        self.export_btn.setEnabled(True)
+        self.export_progress.setVisible(False)
+        QMessageBox.information(self, "Export complete", f"Exported {written} students to {path}.")
+
+    def _export_failed(self, error: Exception):
+        self.export_btn.setEnabled(True)
+        self.export_progress.setVisible(False)
+        QMessageBox.warning(self, "Export failed", str(error))
+
+    def _fetch_page(self, after_id: Optional[int], limit: int) -> List[StudentSummary]:
+        text, status = self._shown_filter
+        return query_students(text, status, after_id=after_id, limit=limit)
 
     def refresh_table(self):
-        data = load_students_from_file()
-        filtered = [s for s in data if self._matches_filter(s)]
-        self.current_entries = filtered
-
-        columns = ["Name", "Student ID", "Status"]
-        self.table.clear()
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels(columns)
-        self.table.setRowCount(len(filtered))
-        self.table.setColumnWidth(0, 180)
-
-        for r, s in enumerate(filtered):
-            original_index = self._find_original_index(s)
-            name = f"{s.get('first_name','')} {s.get('last_name','')}"
-            student_id = s.get("student_id") or s.get("id") or (f"SID-{original_index+1:04d}" if original_index >= 0 else f"SID-{r+1:04d}")
-            item_name = QTableWidgetItem(name)
-            item_name.setFlags(item_name.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item_name.setToolTip(name)
-            item_name.setData(Qt.ItemDataRole.UserRole, original_index)
-            item_id = QTableWidgetItem(student_id)
-            item_id.setFlags(item_id.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item_status = QTableWidgetItem(s.get("status", "pending"))
-            item_status.setFlags(item_status.flags() & ~Qt.ItemFlag.ItemIsEditable)
-
-            self.table.setItem(r, 0, item_name)
-            self.table.setItem(r, 1, item_id)
-            self.table.setItem(r, 2, item_status)
-
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        with tracer.action("refresh_table"):
+            self._search_timer.stop()
+            if self._pending_search is not None:
+                self._pending_search.cancel()
+            self._search_generation += 1
+            query = (self.filter_text, self.filter_status)
+            limit = self.model.batch_size
+            if query == self._shown_filter:
+                limit = max(limit, self.model.rowCount())
+            self._pending_search = run_in_background(
+                search_students, *query, limit=limit, pool=self._search_pool,
+                on_result=partial(self._apply_search, self._search_generation, query),
+                on_error=partial(self._search_failed, self._search_generation)
+            )
+            self._update_loading()
+
+    def _update_loading(self):
+        self.loading_lbl.setVisible(self._pending_search is not None or self.model.is_loading())
+
+    def _apply_search(self, generation: int, query: Tuple[str, str], result):
+        with tracer.span("ui", "table.reload"):
+            if generation != self._search_generation:
+                return
+            self._pending_search = None
+            self._update_loading()
+            self._shown_filter = query
+            total, rows = result
+            self.model.reload(total, rows)
+            self._on_selection_changed()
+
+    def apply_changes(self, changes: List[Tuple[int, int, str]]):
+        if any(op == "reset" for _, _, op in changes):
+            self.refresh_table()
+            return
+        ids = sorted({pk for _, pk, _ in changes})
+        if not ids:
+            return
+        run_in_background(
+            changed_students, ids, *self._shown_filter, pool=self._search_pool,
+            on_result=partial(self._apply_delta, self._search_generation, ids)
+        )
 
-        self.table.setHorizontalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        self.table.resizeRowsToContents()
-        header.setSectionsMovable(False)
-        header.setStretchLastSection(False)
+    def _apply_delta(self, generation: int, ids: List[int], result):
+        with tracer.span("ui", "table.apply_delta"):
+            if generation != self._search_generation:
+                return
+            total, rows = result
+            self.model.apply_delta(ids, rows, total)
+            self._on_selection_changed()
 
-        self._clear_detail()
+    def _search_failed(self, generation: int, error: Exception):
+        if generation != self._search_generation:
+            return
+        self._pending_search = None
+        self._update_loading()
+        QMessageBox.warning(self, "Search failed", f"Could not load students: {error}")
 
-    def _find_original_index(self, student_dict):
-        data = load_students_from_file()
-        for i, s in enumerate(data):
-            if (s.get('first_name') == student_dict.get('first_name') and
-                s.get('last_name') == student_dict.get('last_name') and
-                s.get('email') == student_dict.get('email') and
-                s.get('phone') == student_dict.get('phone') and
-                s.get('date_of_birth') == student_dict.get('date_of_birth')):
-                return i
-        for i, s in enumerate(data):
-            if s.get('email') == student_dict.get('email'):
-                return i
-        return -1
+    def _selected_ids(self) -> List[int]:
+        return [self.model.row_id(index.row()) for index in self.table.selectionModel().selectedRows()]
 
     def _on_selection_changed(self):
-        sel = self.table.selectedIndexes()
-        if not sel:
+        ids = self._selected_ids()
+        if self.role == "admin":
+            self.save_status_btn.setText(f"Save Status ({len(ids)})" if len(ids) > 1 else "Save Status")
+        if self._pending_detail is not None:
+            self._pending_detail.cancel()
+            self._pending_detail = None
+        if len(ids) > 1:
             self._clear_detail()
+            self.lbl_name.setText(f"{len(ids)} students selected")
             return
-        row = sel[0].row()
-        if 0 <= row < len(self.current_entries):
-            student = self.current_entries[row]
-            orig_index = self._find_original_index(student)
-            self._populate_detail(student, orig_index)
-        else:
+        summary = self.model.record(ids[0]) if ids else None
+        if summary is None:
             self._clear_detail()
+            return
+        detail = cached_student_detail(summary.id)
+        if detail is not None:
+            self._populate_detail(detail)
+            return
+        self._clear_detail()
+        self._populate_header(summary)
+        self._pending_detail = run_in_background(
+            load_student_detail, summary.id, pool=self._detail_pool,
+            on_result=partial(self._detail_loaded, summary.id)
+        )
 
-    def _populate_detail(self, s: dict, orig_index: int):
-        initials = (s.get("first_name", " ")[0:1] + s.get("last_name", " ")[0:1]).upper()
-        self.lbl_avatar.setText(initials)
-        name = f"{s.get('first_name','')} {s.get('last_name','')}"
-        self.lbl_name.setText(name)
-        student_id = s.get("student_id") or s.get("id") or (f"SID-{orig_index+1:04d}" if orig_index >= 0 else "")
-        self.lbl_student_id.setText(f"ID: {student_id}")
-
-        self.grid_labels['dob'].setText(s.get("date_of_birth", "") or "N/A")
-        self.grid_labels['gender'].setText(s.get("gender", "") or "N/A")
-        self.grid_labels['email'].setText(s.get("email", "") or "N/A")
-        self.grid_labels['phone'].setText(s.get("phone", "") or "N/A")
-        g = s.get("guardian", {}) or {}
-        gname = g.get("name") if g.get("name") not in (None, "") else "N/A"
-        grel = g.get("relation") if g.get("relation") not in (None, "") else "N/A"
-        self.grid_labels['guardian'].setText(f"{gname} ({grel})")
-        a = s.get("academic", {}) or {}
-        self.grid_labels['strand'].setText(a.get("strand", "") or "N/A")
-        self.grid_labels['semester'].setText(a.get("semester", "") or "N/A")
-        self.grid_labels['school_year'].setText(a.get("school_year", "") or "N/A")
-        submitted = f"{s.get('submitted_by','')} ({s.get('submitted_role','')})" if s.get('submitted_by') else "N/A"
+    def _detail_loaded(self, row_id: int, student: Optional[Student]):
+        self._pending_detail = None
+        if student is not None and self._selected_ids() == [row_id]:
+            self._populate_detail(student)
+
+    def _populate_header(self, s):
+        self.lbl_avatar.setText(s.initials)
+        self.lbl_name.setText(s.full_name)
+        self.lbl_student_id.setText(f"ID: {s.display_id}")
+        self._show_status(s.status)
+
+    def _populate_detail(self, s: Student):
+        self._populate_header(s)
+
+        self.grid_labels['dob'].setText(s.date_of_birth or "N/A")
+        self.grid_labels['gender'].setText(s.gender or "N/A")
+        self.grid_labels['email'].setText(s.email or "N/A")
+        self.grid_labels['phone'].setText(s.phone or "N/A")
+        g = s.guardian
+        self.grid_labels['guardian'].setText(f"{g.name or 'N/A'} ({g.relation or 'N/A'})")
+        a = s.academic
+        self.grid_labels['strand'].setText(a.strand or "N/A")
+        self.grid_labels['semester'].setText(a.semester or "N/A")
+        self.grid_labels['school_year'].setText(a.school_year or "N/A")
+        submitted = f"{s.submitted_by} ({s.submitted_role})" if s.submitted_by else "N/A"
         self.grid_labels['submitted_by'].setText(submitted)
 
-        status_text = s.get("status", "pending").capitalize()
+    def _show_status(self, st: str):
+        status_text = st.capitalize()
 
         if self.role == "admin":
             try:
-                self.admin_status_combo.setCurrentText(s.get("status", "pending"))
+                self.admin_status_combo.setCurrentText(st)
             except Exception:
                 pass
         else:
-            st = s.get("status", "pending")
             if st == "approved":
                 self.detail_status_badge.setStyleSheet("padding:3px 6px; border-radius:8px; font-weight:700; font-size:11px; background-color:#16a34a; color:white;")
             elif st == "declined":
@@ -655,35 +2626,47 @@ class StudentsTable(QWidget):
                 pass
 
     def _open_selected_record(self):
-        sel = self.table.selectedIndexes()
-        if not sel:
+        ids = self._selected_ids()
+        if not ids:
             return
-        row = sel[0].row()
-        if 0 <= row < len(self.current_entries):
-            s = self.current_entries[row]
-            orig_index = self._find_original_index(s)
-            dlg = RecordDialog(s, original_index=orig_index, role=self.role, parent=self)
-            if dlg.exec() == QDialog.DialogCode.Accepted:
-                self.refresh_table()
+        run_in_background(load_student_detail, ids[0], pool=self._detail_pool, on_result=self._open_record)
 
-    def _admin_save_status(self):
-        sel = self.table.selectedIndexes()
-        if not sel:
-            QMessageBox.warning(self, "No selection", "Please select a student.")
+    def _open_record(self, s: Optional[Student]):
+        if s is None:
             return
-        row = sel[0].row()
-        if 0 <= row < len(self.current_entries):
-            s = self.current_entries[row]
+        dlg = RecordDialog(s, role=self.role, parent=self)
+        if dlg.exec() == QDialog.DialogCode.Accepted:
+            self.refresh_table()
+
+    def _admin_save_status(self):
+        with tracer.action("save_status"):
+            ids = self._selected_ids()
+            if not ids:
+                QMessageBox.warning(self, "No selection", "Please select a student.")
+                return
             new_status = self.admin_status_combo.currentText()
-            data = load_students_from_file()
-            orig_index = self._find_original_index(s)
-            if 0 <= orig_index < len(data):
-                data[orig_index]["status"] = new_status
-                save_students_to_file(data)
-                QMessageBox.information(self, "Saved", "Student status updated.")
-                self.refresh_table()
-            else:
-                QMessageBox.warning(self, "Error", "Could not locate student to save.")
+            self.save_status_btn.setEnabled(False)
+            run_in_background(set_students_status, ids, new_status,
+                              on_result=partial(self._status_saved, ids, new_status), on_error=self._status_save_failed)
+
+    def _status_saved(self, ids: List[int], new_status: str, updated: int):
+        self.save_status_btn.setEnabled(True)
+        if not updated:
+            QMessageBox.warning(self, "Error", "Could not locate student to save.")
+            return
+        for row_id in ids:
+            s = self.model.record(row_id)
+            if s is not None:
+                s.status = new_status
+        if len(ids) > 1:
+            QMessageBox.information(self, "Saved", f"Status set to {new_status} for {updated} students.")
+        else:
+            QMessageBox.information(self, "Saved", "Student status updated.")
+        self.refresh_table()
+
+    def _status_save_failed(self, error: Exception):
+        self.save_status_btn.setEnabled(True)
+        QMessageBox.warning(self, "Error", f"Could not save status: {error}")
 
 class DashboardWidget(QWidget):
     def __init__(self, role="staff", parent=None):
@@ -714,31 +2697,19 @@ class DashboardWidget(QWidget):
         self.status_colors = ["#2563eb", "#f59e0b", "#16a34a", "#ef4444"]
         self.status_labels = ["Total", "Pending", "Approved", "Declined"]
 
-        self._chip_widgets = []
-        self._metric_cards = []
+        self._chip_widgets = {}
+        self._chip_slots = {}
+        self._metric_cards = {}
+        self._shown_stats = None
+        self._per_col = None
+        self._loading = None
+        self._refresh_again = False
 
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
 
+        self.last_updated.setText("Loading dashboard...")
         self.refresh()
 
-    def _clear_layout_and_delete(self, layout: QLayout):
-        if layout is None:
-            return
-        while layout.count():
-            item = layout.takeAt(0)
-            if not item:
-                continue
-            w = item.widget()
-            if w is not None:
-                try:
-                    w.deleteLater()
-                except Exception:
-                    pass
-            else:
-                sub = item.layout()
-                if sub is not None:
-                    self._clear_layout_and_delete(sub)
-
     def _make_chip(self, title: str, subtitle: str = "", accent="#2563eb", max_width=None, title_font_size=9, subtitle_font_size=8):
         card = QFrame()
         card.setStyleSheet("QFrame { background: #ffffff; border-radius: 6px; border: 1px solid rgba(15, 23, 42, 0.04); }")
@@ -752,18 +2723,22 @@ class DashboardWidget(QWidget):
         accent_bar.setFixedWidth(4)
         accent_bar.setStyleSheet(f"QFrame {{ background: {accent}; border-radius: 2px; }}")
         lay.addWidget(accent_bar)
+        card.accent_bar = accent_bar
 
         text_block = QVBoxLayout()
         title_lbl = QLabel(title)
         title_lbl.setStyleSheet("font-weight:800; color:#0b1726;")
         title_lbl.setFont(QFont("", title_font_size, QFont.Weight.Bold))
         text_block.addWidget(title_lbl)
+        card.title_lbl = title_lbl
+        card.subtitle_lbl = None
 
         if subtitle:
             sub_lbl = QLabel(subtitle)
             sub_lbl.setStyleSheet("color:#566674;")
             sub_lbl.setFont(QFont("", subtitle_font_size))
             text_block.addWidget(sub_lbl)
+            card.subtitle_lbl = sub_lbl
         else:
             text_block.addSpacing(2)
 
@@ -791,6 +2766,7 @@ class DashboardWidget(QWidget):
         num.setStyleSheet(f"color:{color}; font-weight:900;")
         num.setFont(QFont("", num_font_size, QFont.Weight.Bold))
         v.addWidget(num)
+        card.number_lbl = num
 
         txt = QLabel(label)
         txt.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -806,56 +2782,88 @@ class DashboardWidget(QWidget):
         return card
 
     def refresh(self):
-        try:
-            data = load_students_from_file()
-        except Exception:
-            data = []
-
-        total = len(data)
-        pending = sum(1 for s in data if s.get("status", "pending") == "pending")
-        approved = sum(1 for s in data if s.get("status", "") == "approved")
-        declined = sum(1 for s in data if s.get("status", "") == "declined")
-        counts = [total, pending, approved, declined]
-
-        strand_counts = {}
-        for s in data:
-            a = s.get("academic", {}) or {}
-            st = a.get("strand", "") or "Unspecified"
-            strand_counts[st] = strand_counts.get(st, 0) + 1
-        rows = list(strand_counts.items())
-        rows.sort(key=lambda x: x[1], reverse=True)
-
-        self._clear_layout_and_delete(self.top_grid)
-        self._clear_layout_and_delete(self.metrics_grid)
-        self._chip_widgets = []
-        self._metric_cards = []
-
-        w = max(900, self.width() or 900)
-        per_col = max(140, (w - 36) // 3)
-
-        for i, (strand, cnt) in enumerate(rows):
-            subtitle = f"{cnt} student{'s' if cnt != 1 else ''}"
+        with tracer.action("dashboard_refresh"):
+            if self._loading is not None:
+                self._refresh_again = True
+                return
+            self._loading = run_in_background(load_dashboard_stats, on_result=self._stats_loaded,
+                                              on_error=self._stats_failed)
+
+    def _stats_failed(self, error: Exception):
+        self._stats_loaded({"total": 0, "status": {}, "strands": []})
+
+    def _stats_loaded(self, stats: Dict[str, Any]):
+        self._loading = None
+        self._apply_stats(stats)
+        if self._refresh_again:
+            self._refresh_again = False
+            self.refresh()
+
+    def _apply_stats(self, stats: Dict[str, Any]):
+        with tracer.span("ui", "dashboard.apply_stats"):
+            total = stats["total"]
+            pending = stats["status"].get("pending", 0)
+            approved = stats["status"].get("approved", 0)
+            declined = stats["status"].get("declined", 0)
+            counts = [total, pending, approved, declined]
+            rows = stats["strands"]
+
+            w = max(900, self.width() or 900)
+            per_col = max(140, (w - 36) // 3)
+            shown = (tuple(counts), tuple(rows))
+            if shown == self._shown_stats and per_col == self._per_col:
+                return
+            self._shown_stats = shown
+            resized = per_col != self._per_col
+            self._per_col = per_col
+
             accents = ["#2563eb", "#7c3aed", "#06b6d4", "#f97316", "#10b981", "#ef4444"]
-            accent = accents[i % len(accents)]
-            chip = self._make_chip(strand, subtitle, accent=accent, max_width=per_col, title_font_size=9, subtitle_font_size=8)
-            self._chip_widgets.append(chip)
-            r = i // 3
-            c = i % 3
-            self.top_grid.addWidget(chip, r, c)
-
-        if not rows:
-            hint = self._make_chip("No strands yet", "Submit students to populate strands", accent="#94a3b8", max_width=per_col, title_font_size=9, subtitle_font_size=8)
-            self._chip_widgets.append(hint)
-            self.top_grid.addWidget(hint, 0, 0)
-
-        for i, (label, color, val) in enumerate(zip(self.status_labels, self.status_colors, counts)):
-            card = self._make_metric_card(val, label, color, max_width=per_col, num_font_size=16, label_font_size=9)
-            self._metric_cards.append(card)
-            r = i // 3
-            c = i % 3
-            self.metrics_grid.addWidget(card, r, c)
-
-        self.last_updated.setText(f"Last updated: {total} submissions • Pending {pending}, Approved {approved}, Declined {declined}")
+            chips = [(strand, f"{cnt} student{'s' if cnt != 1 else ''}", accents[i % len(accents)])
+                     for i, (strand, cnt) in enumerate(rows)]
+            if not chips:
+                chips = [(None, "Submit students to populate strands", "#94a3b8")]
+
+            wanted = {key for key, _, _ in chips}
+            for key in [k for k in self._chip_widgets if k not in wanted]:
+                chip = self._chip_widgets.pop(key)
+                self._chip_slots.pop(key, None)
+                self.top_grid.removeWidget(chip)
+                chip.deleteLater()
+
+            for i, (key, subtitle, accent) in enumerate(chips):
+                chip = self._chip_widgets.get(key)
+                if chip is None:
+                    title = key if key is not None else "No strands yet"
+                    chip = self._make_chip(title, subtitle, accent=accent, max_width=per_col, title_font_size=9, subtitle_font_size=8)
+                    chip.accent = accent
+                    self._chip_widgets[key] = chip
+                else:
+                    if chip.subtitle_lbl is not None and chip.subtitle_lbl.text() != subtitle:
+                        chip.subtitle_lbl.setText(subtitle)
+                    if chip.accent != accent:
+                        chip.accent_bar.setStyleSheet(f"QFrame {{ background: {accent}; border-radius: 2px; }}")
+                        chip.accent = accent
+                    if resized:
+                        chip.setMaximumWidth(per_col)
+                slot = (i // 3, i % 3)
+                if self._chip_slots.get(key) != slot:
+                    self.top_grid.removeWidget(chip)
+                    self.top_grid.addWidget(chip, *slot)
+                    self._chip_slots[key] = slot
+
+            for i, (label, color, val) in enumerate(zip(self.status_labels, self.status_colors, counts)):
+                card = self._metric_cards.get(label)
+                if card is None:
+                    card = self._make_metric_card(val, label, color, max_width=per_col, num_font_size=16, label_font_size=9)
+                    self._metric_cards[label] = card
+                    self.metrics_grid.addWidget(card, i // 3, i % 3)
+                else:
+                    if card.number_lbl.text() != str(val):
+                        card.number_lbl.setText(str(val))
+                    if resized:
+                        card.setMaximumWidth(per_col)
+
+            self.last_updated.setText(f"Last updated: {total} submissions • Pending {pending}, Approved {approved}, Declined {declined}")
 
 class StudentForm(QWidget):
     def __init__(self, submit_callback=None, parent=None):
@@ -879,10 +2887,10 @@ class StudentForm(QWidget):
         row1.addWidget(self.first_name); row1.addWidget(self.middle_name); row1.addWidget(self.last_name)
 
         row2 = QHBoxLayout()
-        self.dob = QLineEdit(); self.dob.setPlaceholderText("Date of birth")
+        self.dob = QLineEdit(); self.dob.setPlaceholderText("Date of birth (YYYY-MM-DD)")
         self.dob.setStyleSheet("background-color: white; padding:4px; border:1px solid #ccc; border-radius:6px;")
         self.gender = QComboBox()
-        self.gender.addItem("Select Gender"); self.gender.addItem("Male"); self.gender.addItem("Female"); self.gender.setCurrentIndex(0)
+        self.gender.addItem("Select Gender"); self.gender.addItems(GENDERS); self.gender.setCurrentIndex(0)
         self.gender.setStyleSheet("background-color: white; padding:4px; border:1px solid #ccc; border-radius:6px;")
         row2.addWidget(self.dob, 1); row2.addWidget(self.gender, 1)
 
@@ -903,7 +2911,7 @@ class StudentForm(QWidget):
         self.guardian_name = QLineEdit(); self.guardian_name.setPlaceholderText("Guardian Name (optional)")
         self.guardian_phone = QLineEdit(); self.guardian_phone.setPlaceholderText("Guardian Phone Number (optional)")
         self.guardian_relation = QComboBox()
-        self.guardian_relation.addItem("Select Relation"); self.guardian_relation.addItems(["Father", "Mother", "Legal Guardian", "Others"])
+        self.guardian_relation.addItem("Select Relation"); self.guardian_relation.addItems(GUARDIAN_RELATIONS)
         self.guardian_relation.setCurrentIndex(0)
         for w in (self.guardian_name, self.guardian_phone, self.guardian_relation):
             try:
@@ -918,9 +2926,9 @@ class StudentForm(QWidget):
         self.prev_school = QLineEdit(); self.prev_school.setPlaceholderText("Previous School (optional)")
         self.prev_school.setStyleSheet("background-color: white; padding:4px; border:1px solid #ccc; border-radius:6px;")
         self.strand = QComboBox(); self.strand.addItem("Select Strand")
-        self.strand.addItems(["STEM", "ABM", "GAS", "HUMSS", "TVL", "Arts and Design Track"]); self.strand.setCurrentIndex(0)
-        self.semester = QComboBox(); self.semester.addItem("Select Semester"); self.semester.addItems(["1st Semester", "2nd Semester"]); self.semester.setCurrentIndex(0)
-        self.school_year = QComboBox(); self.school_year.addItem("Select School Year"); self.school_year.addItems(["2025 - 2026", "2026 - 2027"]); self.school_year.setCurrentIndex(0)
+        self.strand.addItems(STRANDS); self.strand.setCurrentIndex(0)
+        self.semester = QComboBox(); self.semester.addItem("Select Semester"); self.semester.addItems(SEMESTERS); self.semester.setCurrentIndex(0)
+        self.school_year = QComboBox(); self.school_year.addItem("Select School Year"); self.school_year.addItems(SCHOOL_YEARS); self.school_year.setCurrentIndex(0)
         for w in (self.strand, self.semester, self.school_year):
             w.setStyleSheet("background-color: white; padding:4px; border:1px solid #ccc; border-radius:6px;")
         ac_layout.addWidget(self.prev_school, 1); ac_layout.addWidget(self.strand, 1); ac_layout.addWidget(self.semester, 1); ac_layout.addWidget(self.school_year, 1)
@@ -938,17 +2946,6 @@ class StudentForm(QWidget):
         email = self.email.text().strip(); phone = self.phone.text().strip()
         gn = self.guardian_name.text().strip(); gp = self.guardian_phone.text().strip()
         prev = self.prev_school.text().strip()
-        if not (fn and ln and dob and email and phone):
-            QMessageBox.warning(self, "Form incomplete", "Please fill in required fields (name, date of birth, email, phone).")
-            return
-        if self.gender.currentIndex() == 0:
-            QMessageBox.warning(self, "Form incomplete", "Please select gender."); return
-        if self.strand.currentIndex() == 0:
-            QMessageBox.warning(self, "Form incomplete", "Please select strand."); return
-        if self.semester.currentIndex() == 0:
-            QMessageBox.warning(self, "Form incomplete", "Please select semester."); return
-        if self.school_year.currentIndex() == 0:
-            QMessageBox.warning(self, "Form incomplete", "Please select school year."); return
 
         guardian_obj = {
             "name": gn if gn else None,
@@ -957,29 +2954,42 @@ class StudentForm(QWidget):
         }
         academic_obj = {
             "previous_school": prev if prev else None,
-            "strand": self.strand.currentText(),
-            "semester": self.semester.currentText(),
-            "school_year": self.school_year.currentText()
+            "strand": self.strand.currentText() if self.strand.currentIndex() != 0 else "",
+            "semester": self.semester.currentText() if self.semester.currentIndex() != 0 else "",
+            "school_year": self.school_year.currentText() if self.school_year.currentIndex() != 0 else ""
         }
 
         student = {
             "first_name": fn,
             "last_name": ln,
             "date_of_birth": dob,
-            "gender": self.gender.currentText(),
+            "gender": self.gender.currentText() if self.gender.currentIndex() != 0 else "",
             "email": email,
             "phone": phone,
             "guardian": guardian_obj,
             "academic": academic_obj,
             "status": "pending"
         }
+        error = validate_student(student)
+        if error:
+            QMessageBox.warning(self, "Form incomplete", error)
+            return
 
-        if callable(self.submit_callback):
-            self.submit_callback(student)
+        if not callable(self.submit_callback):
+            self._submitted(None)
+            return
+        self.submit_btn.setEnabled(False)
+        self.submit_callback(student, self._submitted, self._submit_failed)
 
+    def _submitted(self, _row_id):
+        self.submit_btn.setEnabled(True)
         QMessageBox.information(self, "Submitted", "Student added with status 'pending'.")
         self._clear()
 
+    def _submit_failed(self, error: Exception):
+        self.submit_btn.setEnabled(True)
+        QMessageBox.warning(self, "Submit failed", f"Could not save the student: {error}")
+
     def _clear(self):
         for w in (self.first_name, self.middle_name, self.last_name, self.dob, self.email, self.phone, self.guardian_name, self.guardian_phone, self.prev_school):
             try:
@@ -992,7 +3002,185 @@ class StudentForm(QWidget):
             except Exception:
                 pass
 
+class ImportDialog(QDialog):
+    def __init__(self, user: dict, parent=None):
+        super().__init__(parent)
+        self.user = user or {}
+        self.imported = False
+        self._task = None
+        self.setWindowTitle("Import Enrollment Batch")
+        self.setMinimumSize(540, 380)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(8)
+
+        file_row = QHBoxLayout()
+        self.path_edit = QLineEdit()
+        self.path_edit.setPlaceholderText("CSV or XLSX file")
+        self.path_edit.setStyleSheet("padding:4px; border:1px solid #d0d7de; border-radius:6px;")
+        browse_btn = QPushButton("Browse...")
+        browse_btn.clicked.connect(self._browse)
+        file_row.addWidget(self.path_edit, 1)
+        file_row.addWidget(browse_btn)
+        layout.addLayout(file_row)
+
+        hint = QLabel("Columns: first_name, last_name, date_of_birth, gender, email, phone, strand, semester, school_year. "
+                      "Optional: guardian_name, guardian_phone, guardian_relation, previous_school.")
+        hint.setWordWrap(True)
+        hint.setStyleSheet("color:#556675; font-size:11px;")
+        layout.addWidget(hint)
+
+        self.progress = QProgressBar()
+        self.progress.setRange(0, 1)
+        self.progress.setValue(0)
+        layout.addWidget(self.progress)
+        self.status_lbl = QLabel("")
+        self.status_lbl.setStyleSheet("font-size:11px; color:#0b1726;")
+        layout.addWidget(self.status_lbl)
+
+        self.errors_view = QPlainTextEdit()
+        self.errors_view.setReadOnly(True)
+        self.errors_view.setPlaceholderText("Rows that could not be imported are listed here.")
+        layout.addWidget(self.errors_view, 1)
+
+        btn_row = QHBoxLayout()
+        btn_row.addStretch()
+        self.import_btn = QPushButton("Import")
+        self.import_btn.setStyleSheet("QPushButton { background-color:#2563eb; color: white; padding:6px 10px; border-radius:8px; }")
+        self.import_btn.clicked.connect(self._start)
+        self.close_btn = QPushButton("Close")
+        self.close_btn.setStyleSheet("QPushButton { background-color:#e5e7eb; padding:6px 10px; border-radius:8px; }")
+        self.close_btn.clicked.connect(self.reject)
+        btn_row.addWidget(self.import_btn)
+        btn_row.addWidget(self.close_btn)
+        layout.addLayout(btn_row)
+
+    def _browse(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Select enrollment file", "", "Enrollment files (*.csv *.xlsx);;All files (*)")
+        if path:
+            self.path_edit.setText(path)
+
+    def _set_running(self, running: bool):
+        self.import_btn.setEnabled(not running)
+        self.close_btn.setEnabled(not running)
+        self.progress.setRange(0, 0 if running else 1)
+        self.progress.setValue(0 if running else 1)
+
+    def _start(self):
+        with tracer.action("import"):
+            path = self.path_edit.text().strip()
+            if not path:
+                QMessageBox.warning(self, "No file", "Please choose a CSV or XLSX file.")
+                return
+            self.errors_view.clear()
+            self.status_lbl.setText("Importing...")
+            self._set_running(True)
+            self._task = run_in_background(
+                import_students, path, self.user.get("username"), self.user.get("role", "staff"),
+                on_progress=self._on_progress, on_result=self._on_done, on_error=self._on_failed
+            )
+
+    def _on_progress(self, report: ImportReport):
+        self.status_lbl.setText(f"{report.processed} rows read, {report.inserted} imported, {len(report.errors)} errors")
+
+    def _on_done(self, report: ImportReport):
+        self._task = None
+        self._set_running(False)
+        self.imported = self.imported or report.inserted > 0
+        self.status_lbl.setText(f"Imported {report.inserted} of {report.processed} rows in {report.elapsed:.1f}s "
+                                f"({len(report.errors)} errors)")
+        self.errors_view.setPlainText("\n".join(f"Line {line_no}: {message}" for line_no, message in report.errors))
+
+    def _on_failed(self, error: Exception):
+        self._task = None
+        self._set_running(False)
+        self.status_lbl.setText("Import failed.")
+        QMessageBox.warning(self, "Import failed", str(error))
+
+    def reject(self):
+        if self._task is None:
+            super().reject()
+
+class DebugPanel(QDialog):
+    action_finished = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Performance")
+        self.setMinimumSize(640, 420)
+        self._actions: List[Action] = []
+        self.statement_view = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(6)
+        hint = QLabel(f"Last {TRACE_HISTORY} actions. Slow queries (>= {SLOW_QUERY_MS:g} ms) are also written to "
+                      f"{TRACE_LOG_PATH or 'nowhere (logging disabled)'}.")
+        hint.setWordWrap(True)
+        hint.setStyleSheet("color:#556675; font-size:11px;")
+        layout.addWidget(hint)
+        self.action_list = QListWidget()
+        self.action_list.setStyleSheet("font-family: monospace; font-size:11px;")
+        self.action_list.currentRowChanged.connect(self._show_spans)
+        layout.addWidget(self.action_list, 1)
+        self.span_view = QPlainTextEdit()
+        self.span_view.setReadOnly(True)
+        self.span_view.setStyleSheet("font-family: monospace; font-size:11px;")
+        layout.addWidget(self.span_view, 1)
+        layout.addWidget(QLabel("Statements (slowest total first)"))
+        self.statement_view = QPlainTextEdit()
+        self.statement_view.setReadOnly(True)
+        self.statement_view.setStyleSheet("font-family: monospace; font-size:11px;")
+        layout.addWidget(self.statement_view, 1)
+
+        for action in tracer.history:
+            self._add(action)
+        self._show_statements()
+        # finished actions can come from pool threads, so hop to the GUI thread through a signal
+        self.action_finished.connect(self._add)
+        self._listener = self.action_finished.emit
+        tracer.listeners.append(self._listener)
+
+    @staticmethod
+    def _summary(action: Action) -> str:
+        parts = action.breakdown()
+        started = datetime.fromtimestamp(action.started).strftime("%H:%M:%S")
+        return (f"{started}  {action.name:<22} {action.total_ms or 0:8.1f} ms   "
+                f"db {action.queries:3d}q {parts.get('query', 0):7.1f} ms   "
+                f"reshape {parts.get('reshape', 0):6.1f} ms   ui {parts.get('ui', 0):6.1f} ms")
+
+    def _add(self, action: Action):
+        self._actions.insert(0, action)
+        self.action_list.insertItem(0, self._summary(action))
+        while len(self._actions) > TRACE_HISTORY:
+            self._actions.pop()
+            self.action_list.takeItem(self.action_list.count() - 1)
+        if action.queries and self.statement_view is not None:
+            self._show_statements()
+
+    def _show_statements(self):
+        lines = [f"{'statement':<32} {'count':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'total ms':>10}"]
+        for r in query_stats():
+            lines.append(f"{r['statement']:<32} {r['count']:7d} {r['p50_ms']:8.2f} {r['p95_ms']:8.2f} "
+                         f"{r['p99_ms']:8.2f} {r['max_ms']:8.2f} {r['total_ms']:10.1f}")
+        self.statement_view.setPlainText("\n".join(lines))
+
+    def _show_spans(self, row: int):
+        if not 0 <= row < len(self._actions):
+            self.span_view.clear()
+            return
+        self.span_view.setPlainText("\n".join(f"{kind:<8} {ms:9.2f} ms  {name}"
+                                               for kind, name, ms in self._actions[row].spans))
+
+    def done(self, result):
+        if self._listener in tracer.listeners:
+            tracer.listeners.remove(self._listener)
+        super().done(result)
+
 class MainWindow(QWidget):
+    CHANGE_POLL_MS = 3000
+
     def __init__(self, user):
         super().__init__()
         self.user = user or {"username": "unknown", "role": "staff"}
@@ -1056,82 +3244,208 @@ class MainWindow(QWidget):
         self.btn_dashboard = QPushButton("Dashboard")
         self.btn_submit_page = QPushButton("Submit Student")
         self.btn_view_page = QPushButton("View Students")
-        for b in (self.btn_dashboard, self.btn_submit_page, self.btn_view_page):
+        self.btn_import = QPushButton("Import Batch")
+        for b in (self.btn_dashboard, self.btn_submit_page, self.btn_view_page, self.btn_import):
             b.setStyleSheet("QPushButton { background-color: white; border: 1px solid #d6dbe7; border-radius:6px; padding:5px 8px; font-size:12px; } QPushButton:hover { background-color:#f7fafc; }")
             b.setFixedHeight(28)
 
         header_row.addWidget(self.btn_dashboard)
         if self.user.get("role") == "staff":
             header_row.addWidget(self.btn_submit_page)
+            header_row.addWidget(self.btn_import)
         header_row.addWidget(self.btn_view_page)
         fg_layout.addLayout(header_row)
 
         self.stack = QStackedWidget()
         fg_layout.addWidget(self.stack)
 
-        self.dashboard = DashboardWidget(role=self.user.get("role"))
-        self.dashboard_scroll = QScrollArea()
-        self.dashboard_scroll.setWidgetResizable(True)
-        self.dashboard_scroll.setWidget(self.dashboard)
-
-        self.form_page = StudentForm(submit_callback=self._staff_submit)
-        self.table_page = StudentsTable(role=self.user.get("role"))
-
-        self.stack.addWidget(self.dashboard_scroll)
-        self.stack.addWidget(self.form_page)
-        self.stack.addWidget(self.table_page)
+        self.dashboard = None
+        self.form_page = None
+        self.table_page = None
+        self._pages: Dict[str, QWidget] = {}
+        self._page_factories = {
+            "dashboard": self._build_dashboard,
+            "form": self._build_form,
+            "table": self._build_table
+        }
 
-        self.btn_dashboard.clicked.connect(lambda: self._show_page(self.dashboard_scroll))
+        self.btn_dashboard.clicked.connect(lambda: self._show_page("dashboard"))
         if self.user.get("role") == "staff":
-            self.btn_submit_page.clicked.connect(lambda: self._show_page(self.form_page))
-        self.btn_view_page.clicked.connect(lambda: self._show_page(self.table_page))
+            self.btn_submit_page.clicked.connect(lambda: self._show_page("form"))
+            self.btn_import.clicked.connect(self._open_import)
+        self.btn_view_page.clicked.connect(lambda: self._show_page("table"))
 
-        self._show_page(self.dashboard_scroll)
+        self._show_page("dashboard")
 
         main_layout.addWidget(foreground)
         self.setLayout(main_layout)
 
-    def _show_page(self, widget: QWidget):
-        try:
-            if widget is self.dashboard_scroll:
-                self.dashboard.refresh()
-            elif widget is self.table_page:
-                self.table_page.refresh_table()
-        except Exception:
-            pass
-        self.stack.setCurrentWidget(widget)
-
-    def _staff_submit(self, student):
-        student["submitted_by"] = self.user.get("username")
-        student["submitted_role"] = self.user.get("role")
-        data = load_students_from_file()
-        student["student_id"] = generate_student_id()
-        data.append(student)
-        save_students_to_file(data)
-        try:
+        self._change_version = None
+        self._change_poll = None
+        self._change_pool = QThreadPool(self)
+        self._change_pool.setMaxThreadCount(1)
+        self._change_timer = QTimer(self)
+        self._change_timer.setInterval(self.CHANGE_POLL_MS)
+        self._change_timer.timeout.connect(self._poll_changes)
+        self._change_timer.start()
+        self._poll_changes()
+
+        self._debug_panel = None
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=self._toggle_debug_panel)
+
+    def _toggle_debug_panel(self):
+        if self._debug_panel is not None and self._debug_panel.isVisible():
+            self._debug_panel.close()
+            return
+        if self._debug_panel is None:
+            self._debug_panel = DebugPanel(parent=self)
+            self._debug_panel.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+            self._debug_panel.destroyed.connect(self._debug_panel_closed)
+        self._debug_panel.show()
+        self._debug_panel.raise_()
+
+    def _debug_panel_closed(self, _obj=None):
+        self._debug_panel = None
+
+    def _build_dashboard(self) -> QWidget:
+        self.dashboard = DashboardWidget(role=self.user.get("role"))
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(self.dashboard)
+        return scroll
+
+    def _build_form(self) -> QWidget:
+        self.form_page = StudentForm(submit_callback=self._staff_submit)
+        return self.form_page
+
+    def _build_table(self) -> QWidget:
+        self.table_page = StudentsTable(role=self.user.get("role"))
+        return self.table_page
+
+    def _show_page(self, name: str):
+        with tracer.action(f"show_page:{name}"):
+            page = self._pages.get(name)
+            if page is None:
+                # pages load their own data when built, so only revisits need a refresh
+                with tracer.span("ui", f"build_page:{name}"):
+                    page = self._page_factories[name]()
+                self._pages[name] = page
+                self.stack.addWidget(page)
+            else:
+                try:
+                    if name == "dashboard":
+                        self.dashboard.refresh()
+                    elif name == "table":
+                        self.table_page.refresh_table()
+                except Exception:
+                    pass
+            self.stack.setCurrentWidget(page)
+
+    def _refresh_pages(self):
+        if self.table_page is not None:
             self.table_page.refresh_table()
-        except Exception:
-            pass
-        try:
+        if self.dashboard is not None:
             self.dashboard.refresh()
-        except Exception:
-            pass
+
+    def _staff_submit(self, student, on_result: Optional[Callable] = None, on_error: Optional[Callable] = None):
+        with tracer.action("submit_student"):
+            student["submitted_by"] = self.user.get("username")
+            student["submitted_role"] = self.user.get("role")
+            return run_in_background(insert_student, student,
+                                     on_result=partial(self._student_submitted, on_result), on_error=on_error)
+
+    def _student_submitted(self, on_result: Optional[Callable], row_id: int):
+        if on_result is not None:
+            on_result(row_id)
+        self._refresh_pages()
+
+    def _open_import(self):
+        dlg = ImportDialog(self.user, parent=self)
+        dlg.exec()
+        if dlg.imported:
+            self._refresh_pages()
+
+    def _poll_changes(self):
+        if self._change_poll is not None:
+            return
+        self._change_poll = run_in_background(
+            changes_since, self._change_version, pool=self._change_pool,
+            on_result=self._apply_changes, on_error=self._poll_failed
+        )
+
+    def _poll_failed(self, error: Exception):
+        self._change_poll = None
+
+    def _apply_changes(self, result):
+        self._change_poll = None
+        version, changes = result
+        known, self._change_version = self._change_version, version
+        if known is None or version == known:
+            return
+        with tracer.action("apply_changes"):
+            if changes is None:
+                self._refresh_pages()
+                return
+            if self.table_page is not None:
+                self.table_page.apply_changes(changes)
+            if self.dashboard is not None:
+                self.dashboard.refresh()
 
     def logout(self):
+        self._change_timer.stop()
         self.close()
 
+STARTUP_TIMINGS: Dict[str, float] = {}
+
+def _report_startup(label: str, since: float):
+    elapsed = (time.perf_counter() - since) * 1000
+    STARTUP_TIMINGS[label] = elapsed
+    print(f"startup: {label} in {elapsed:.0f} ms", file=sys.stderr)
+
 def run_app():
+    started = time.perf_counter()
     app = QApplication(sys.argv)
     while True:
         login = LoginDialog()
+        if "login_window" not in STARTUP_TIMINGS:
+            QTimer.singleShot(0, partial(_report_startup, "login_window", started))
         if login.exec() == QDialog.DialogCode.Accepted and login.user:
+            accepted = time.perf_counter()
             w = MainWindow(login.user)
             w.setWindowTitle(f"SHS Enrollment System - {login.user.get('username')}")
             w.showMaximized()
+            QTimer.singleShot(0, partial(_report_startup, "main_window", accepted))
             app.exec()
             continue
         else:
             break
+    tracer.write({"type": "query_stats", "at": datetime.now().isoformat(timespec="seconds"),
+                  "statements": query_stats()})
+
+def run_import(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="script.py import",
+                                     description="Bulk import enrollment applicants from a CSV or XLSX file.")
+    parser.add_argument("path", help="CSV or XLSX file with a header row")
+    parser.add_argument("--submitted-by", default="import", help="username recorded as the submitter")
+    parser.add_argument("--role", default="staff", help="role recorded as the submitter's role")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE, help="rows per transaction")
+    args = parser.parse_args(argv)
+
+    ensure_schema()
+    if args.chunk_size > import_chunk_limit():
+        print(f"--chunk-size {args.chunk_size} exceeds the {get_backend().name} parameter limit; "
+              f"using {import_chunk_limit()}", file=sys.stderr)
+    report = import_students(
+        args.path, args.submitted_by, args.role, chunk_size=args.chunk_size,
+        progress=lambda r: print(f"\r{r.processed} rows read, {r.inserted} imported", end="", file=sys.stderr)
+    )
+    print(file=sys.stderr)
+    for line_no, message in report.errors:
+        print(f"line {line_no}: {message}")
+    print(f"Imported {report.inserted} of {report.processed} rows in {report.elapsed:.1f}s ({len(report.errors)} errors)")
+    return 1 if report.errors else 0
 
 if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == "import":
+        sys.exit(run_import(sys.argv[2:]))
     run_app()